@@ -22,6 +22,7 @@ Usage:
 
 import os
 from datetime import date
+from functools import cache
 from typing import Any
 
 import pandas as pd
@@ -272,11 +273,12 @@ def download(
     return {sym: fetch(sym, start, end, source) for sym in symbols}
 
 
-def available_sources() -> list[str]:
-    """List available data sources.
+@cache
+def _installed_sources() -> tuple[str, ...]:
+    """Probe source imports once; installed packages don't change at runtime.
 
-    Returns:
-        List of source names that are installed and available.
+    Call ``_installed_sources.cache_clear()`` after installing or mocking a
+    source library.
     """
     available = []
     for source in SOURCES:
@@ -285,4 +287,13 @@ def available_sources() -> list[str]:
             available.append(source)
         except ImportError:
             pass
-    return available
+    return tuple(available)
+
+
+def available_sources() -> list[str]:
+    """List available data sources.
+
+    Returns:
+        List of source names that are installed and available.
+    """
+    return list(_installed_sources())
@@ -1,14 +1,43 @@
 """Momentum indicator functions."""
 
+from functools import lru_cache
+
 import numpy as np
+import numpy.typing as npt
 import pandas as pd
 
 from pyutss.engine.indicators.moving_averages import ema, sma
 from pyutss.engine.indicators.results import MACDResult, StochasticResult
 
+# Series longer than this bypass the RSI cache to bound its memory use
+_RSI_CACHE_MAX_POINTS = 4096
+
 
 def rsi(data: pd.Series, period: int = 14) -> pd.Series:
-    """Relative Strength Index."""
+    """Relative Strength Index.
+
+    Short numeric series are memoized on their raw values and period, so
+    screening or ranking the same prices repeatedly computes RSI once. The
+    cache is process-global and keeps the 64 most recent results; call
+    ``_rsi_cached.cache_clear()`` to release it.
+    """
+    if len(data) <= _RSI_CACHE_MAX_POINTS and pd.api.types.is_numeric_dtype(data):
+        values = _rsi_cached(data.to_numpy(dtype=np.float64).tobytes(), period)
+        return pd.Series(values, index=data.index, name=data.name, copy=True)
+    return _rsi(data, period)
+
+
+@lru_cache(maxsize=64)
+def _rsi_cached(close_bytes: bytes, period: int) -> npt.NDArray[np.float64]:
+    """RSI over a raw float64 buffer, cached by value (process-global)."""
+    close = pd.Series(np.frombuffer(close_bytes, dtype=np.float64))
+    values: npt.NDArray[np.float64] = _rsi(close, period).to_numpy(dtype=np.float64)
+    values.setflags(write=False)
+    return values
+
+
+def _rsi(data: pd.Series, period: int) -> pd.Series:
+    """Uncached RSI using Wilder smoothing."""
     delta = data.diff()
     gain = delta.where(delta > 0, 0.0)
     loss = (-delta).where(delta < 0, 0.0)
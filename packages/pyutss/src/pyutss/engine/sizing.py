@@ -182,6 +182,5 @@ def round_to_lot(quantity: float, lot_size: int = 1, fractional: bool = False) -
     if lot_size <= 1:
         return math.floor(quantity)
 
-    # Round down to nearest lot
-    lots = math.floor(quantity / lot_size)
-    return float(lots * lot_size)
+    # Floor-division rounds down to the nearest lot in one step
+    return float(quantity // lot_size * lot_size)
@@ -10,6 +10,7 @@ symbols that match the conditions.
 from __future__ import annotations
 
 import logging
+from collections import ChainMap
 from typing import Any
 
 import pandas as pd
@@ -48,9 +49,10 @@ class UniverseResolver:
         Args:
             custom_indices: Additional custom index definitions
         """
-        self._indices = {**INDEX_CONSTITUENTS}
-        if custom_indices:
-            self._indices.update(custom_indices)
+        # Custom indices shadow the shared constituents without copying them;
+        # ChainMap writes only ever touch the first (per-resolver) map.
+        own: dict[str, list[str]] = dict(custom_indices) if custom_indices else {}
+        self._indices: ChainMap[str, list[str]] = ChainMap(own, INDEX_CONSTITUENTS)
 
     def resolve(
         self,
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from datetime import date
+from functools import lru_cache
 
 from pyutss.engine.executor import BacktestExecutor, OrderRequest
 from pyutss.engine.portfolio import PortfolioManager
@@ -12,18 +13,28 @@ from pyutss.portfolio.weights import EqualWeight, WeightScheme
 def get_weight_scheme(
     weights: str | WeightScheme | dict[str, float],
 ) -> WeightScheme:
-    """Get weight scheme from specification."""
+    """Get weight scheme from specification.
+
+    Named schemes are shared instances; they hold only configuration, so
+    callers must not mutate them.
+    """
     if isinstance(weights, WeightScheme):
         return weights
     if isinstance(weights, dict):
         from pyutss.portfolio.weights import TargetWeights
         return TargetWeights(weights)
-    if weights == "equal":
+    return _scheme_from_name(weights)
+
+
+@lru_cache(maxsize=16)
+def _scheme_from_name(name: str) -> WeightScheme:
+    """Build the default-configured scheme for a name (cached)."""
+    if name == "equal":
         return EqualWeight()
-    if weights == "inverse_vol":
+    if name == "inverse_vol":
         from pyutss.portfolio.weights import InverseVolatility
         return InverseVolatility()
-    if weights == "risk_parity":
+    if name == "risk_parity":
         from pyutss.portfolio.weights import RiskParity
         return RiskParity()
     return EqualWeight()
@@ -44,15 +55,19 @@ def get_current_weights(
     pm: PortfolioManager,
     prices: dict[str, float],
 ) -> dict[str, float]:
-    """Get current portfolio weights."""
-    equity = pm.get_equity(prices)
+    """Get current portfolio weights.
+
+    Position values (market price, falling back to avg_price) are computed
+    in one pass and reused for the equity total.
+    """
+    values = {
+        symbol: pos.quantity * prices.get(symbol, pos.avg_price)
+        for symbol, pos in pm.positions.items()
+    }
+    equity = pm.cash + sum(values.values())
     if equity <= 0:
         return {}
-    weights = {}
-    for symbol, pos in pm.positions.items():
-        p = prices.get(symbol, pos.avg_price)
-        weights[symbol] = (pos.quantity * p) / equity
-    return weights
+    return {symbol: value / equity for symbol, value in values.items()}
 
 
 def rebalance(
@@ -67,14 +82,15 @@ def rebalance(
     turnover = 0.0
 
     for symbol in symbols:
-        target_weight = target_weights.get(symbol, 0)
-        target_value = equity * target_weight
+        # Reject unpriced symbols and sub-0.01-share adjustments before
+        # touching the executor or portfolio.
         price = prices.get(symbol, 0)
         if price <= 0:
             continue
 
-        target_qty = target_value / price
-        current_qty = pm.positions[symbol].quantity if symbol in pm.positions else 0
+        target_qty = equity * target_weights.get(symbol, 0.0) / price
+        position = pm.positions.get(symbol)
+        current_qty = position.quantity if position is not None else 0
         delta_qty = target_qty - current_qty
 
         if abs(delta_qty) < 0.01:
@@ -66,6 +66,19 @@ class TestMomentum:
         assert result.iloc[:10].isna().all()
         assert result.dropna().shape[0] > 0
 
+    def test_rsi_cache_matches_uncached(self):
+        from pyutss.engine.indicators.momentum import _rsi
+
+        data = _make_data()
+        first = IndicatorService.rsi(data["close"], 14)
+        second = IndicatorService.rsi(data["close"], 14)
+        pd.testing.assert_series_equal(first, _rsi(data["close"], 14))
+        # Cached results are independent copies with the caller's index
+        assert first is not second
+        assert first.index.equals(data.index)
+        second.iloc[-1] = -1.0
+        assert IndicatorService.rsi(data["close"], 14).iloc[-1] == first.iloc[-1]
+
 
 class TestStatistical:
     """Test statistical indicators."""
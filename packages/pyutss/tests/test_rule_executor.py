@@ -15,26 +15,39 @@ from pyutss.engine.rule_executor import (
     precompute_rules,
 )
 
-
-def _make_ohlcv(n: int = 50, base_price: float = 100.0) -> pd.DataFrame:
-    """Create synthetic OHLCV data for testing."""
-    dates = pd.bdate_range("2024-01-01", periods=n, freq="B")
+# Entry date for setup positions and the trading date for calls under test
+_D_OPEN = date(2024, 2, 1)
+_D_CLOSE = date(2024, 3, 1)
+
+
+def _make_ohlcv(
+    n: int = 50,
+    base_price: float = 100.0,
+    freq: str = "B",
+    with_volume: bool = False,
+) -> pd.DataFrame:
+    """Create synthetic OHLCV data for testing.
+
+    Volume is omitted unless requested; routing and constraint tests only
+    read prices.
+    """
+    dates = pd.date_range("2024-01-01", periods=n, freq=freq)
     close = [base_price + i * 0.5 for i in range(n)]
-    return pd.DataFrame(
-        {
-            "open": [c - 0.5 for c in close],
-            "high": [c + 1.0 for c in close],
-            "low": [c - 1.0 for c in close],
-            "close": close,
-            "volume": [1_000_000] * n,
-        },
-        index=dates,
-    )
+    columns = {
+        "open": [c - 0.5 for c in close],
+        "high": [c + 1.0 for c in close],
+        "low": [c - 1.0 for c in close],
+        "close": close,
+    }
+    if with_volume:
+        columns["volume"] = [1_000_000] * n
+    return pd.DataFrame(columns, index=dates)
 
 
 @pytest.fixture
 def data():
-    return _make_ohlcv()
+    # Routing tests don't depend on the trading calendar
+    return _make_ohlcv(freq="D")
 
 
 @pytest.fixture
@@ -71,7 +84,7 @@ class TestExecuteRuleRouting:
             }
         }
         execute_rule(
-            executor, rule, "AAPL", 100.0, date(2024, 3, 1),
+            executor, rule, "AAPL", 100.0, _D_CLOSE,
             context, {}, pm, data,
         )
         assert "AAPL" in pm.positions
@@ -80,7 +93,7 @@ class TestExecuteRuleRouting:
         """Alert action logs but does not trade."""
         rule = {"then": {"type": "alert", "message": "Signal fired"}}
         execute_rule(
-            executor, rule, "AAPL", 100.0, date(2024, 3, 1),
+            executor, rule, "AAPL", 100.0, _D_CLOSE,
             context, {}, pm, data,
         )
         assert len(pm.positions) == 0
@@ -89,7 +102,7 @@ class TestExecuteRuleRouting:
         """Hold action is a no-op."""
         rule = {"then": {"type": "hold"}}
         execute_rule(
-            executor, rule, "AAPL", 100.0, date(2024, 3, 1),
+            executor, rule, "AAPL", 100.0, _D_CLOSE,
             context, {}, pm, data,
         )
         assert len(pm.positions) == 0
@@ -103,7 +116,7 @@ class TestExecuteRuleRouting:
             }
         }
         execute_rule(
-            executor, rule, "AAPL", 100.0, date(2024, 3, 1),
+            executor, rule, "AAPL", 100.0, _D_CLOSE,
             context, {}, pm, data,
         )
         assert "AAPL" in pm.positions
@@ -115,45 +128,45 @@ class TestExecuteRuleRouting:
 class TestExecuteTradeDirection:
     def test_buy_opens_long(self, executor, pm, context, data):
         action = {"direction": "buy", "sizing": {"type": "percent_of_equity", "percent": 10}}
-        execute_trade(executor, action, "AAPL", 100.0, date(2024, 3, 1), context, {}, pm, data)
+        execute_trade(executor, action, "AAPL", 100.0, _D_CLOSE, context, {}, pm, data)
         assert pm.positions["AAPL"].direction == "long"
 
     def test_long_opens_long(self, executor, pm, context, data):
         action = {"direction": "long", "sizing": {"type": "percent_of_equity", "percent": 10}}
-        execute_trade(executor, action, "AAPL", 100.0, date(2024, 3, 1), context, {}, pm, data)
+        execute_trade(executor, action, "AAPL", 100.0, _D_CLOSE, context, {}, pm, data)
         assert pm.positions["AAPL"].direction == "long"
 
     def test_sell_closes_position(self, executor, pm, context, data):
         """sell/close direction closes existing position."""
-        pm.open_position("AAPL", 10, 100.0, "long", date(2024, 2, 1))
+        pm.open_position("AAPL", 10, 100.0, "long", _D_OPEN)
         action = {"direction": "sell"}
-        execute_trade(executor, action, "AAPL", 110.0, date(2024, 3, 1), context, {}, pm, data)
+        execute_trade(executor, action, "AAPL", 110.0, _D_CLOSE, context, {}, pm, data)
         assert "AAPL" not in pm.positions
 
     def test_close_closes_position(self, executor, pm, context, data):
-        pm.open_position("AAPL", 10, 100.0, "long", date(2024, 2, 1))
+        pm.open_position("AAPL", 10, 100.0, "long", _D_OPEN)
         action = {"direction": "close"}
-        execute_trade(executor, action, "AAPL", 110.0, date(2024, 3, 1), context, {}, pm, data)
+        execute_trade(executor, action, "AAPL", 110.0, _D_CLOSE, context, {}, pm, data)
         assert "AAPL" not in pm.positions
 
     def test_sell_noop_without_position(self, executor, pm, context, data):
         """Sell with no position is a no-op."""
         action = {"direction": "sell"}
-        execute_trade(executor, action, "AAPL", 100.0, date(2024, 3, 1), context, {}, pm, data)
+        execute_trade(executor, action, "AAPL", 100.0, _D_CLOSE, context, {}, pm, data)
         assert len(pm.positions) == 0
         assert len(pm.trades) == 0
 
     def test_cover_closes_short(self, executor, pm, context, data):
-        pm.open_position("AAPL", 10, 100.0, "short", date(2024, 2, 1))
+        pm.open_position("AAPL", 10, 100.0, "short", _D_OPEN)
         action = {"direction": "cover"}
-        execute_trade(executor, action, "AAPL", 90.0, date(2024, 3, 1), context, {}, pm, data)
+        execute_trade(executor, action, "AAPL", 90.0, _D_CLOSE, context, {}, pm, data)
         assert "AAPL" not in pm.positions
 
     def test_cover_noop_on_long(self, executor, pm, context, data):
         """Cover on a long position is a no-op."""
-        pm.open_position("AAPL", 10, 100.0, "long", date(2024, 2, 1))
+        pm.open_position("AAPL", 10, 100.0, "long", _D_OPEN)
         action = {"direction": "cover"}
-        execute_trade(executor, action, "AAPL", 110.0, date(2024, 3, 1), context, {}, pm, data)
+        execute_trade(executor, action, "AAPL", 110.0, _D_CLOSE, context, {}, pm, data)
         assert "AAPL" in pm.positions  # Still open
 
 
@@ -163,24 +176,24 @@ class TestExecuteTradeDirection:
 class TestConstraints:
     def test_max_positions_blocks_entry(self, executor, pm, context, data):
         """Cannot open more positions than max_positions."""
-        pm.open_position("AAPL", 10, 100.0, "long", date(2024, 2, 1))
+        pm.open_position("AAPL", 10, 100.0, "long", _D_OPEN)
         constraints = {"max_positions": 1}
         action = {"direction": "buy", "sizing": {"type": "percent_of_equity", "percent": 10}}
-        execute_trade(executor, action, "MSFT", 200.0, date(2024, 3, 1), context, constraints, pm, data)
+        execute_trade(executor, action, "MSFT", 200.0, _D_CLOSE, context, constraints, pm, data)
         assert "MSFT" not in pm.positions
 
     def test_no_shorting_blocks_short(self, executor, pm, context, data):
         constraints = {"no_shorting": True}
         action = {"direction": "short", "sizing": {"type": "percent_of_equity", "percent": 10}}
-        execute_trade(executor, action, "AAPL", 100.0, date(2024, 3, 1), context, constraints, pm, data)
+        execute_trade(executor, action, "AAPL", 100.0, _D_CLOSE, context, constraints, pm, data)
         assert len(pm.positions) == 0
 
     def test_max_positions_allows_sell(self, executor, pm, context, data):
         """Sell is allowed even when max_positions is reached."""
-        pm.open_position("AAPL", 10, 100.0, "long", date(2024, 2, 1))
+        pm.open_position("AAPL", 10, 100.0, "long", _D_OPEN)
         constraints = {"max_positions": 1}
         action = {"direction": "sell"}
-        execute_trade(executor, action, "AAPL", 110.0, date(2024, 3, 1), context, constraints, pm, data)
+        execute_trade(executor, action, "AAPL", 110.0, _D_CLOSE, context, constraints, pm, data)
         assert "AAPL" not in pm.positions
 
 
@@ -1,29 +1,70 @@
 """Tests for screener universe with filter evaluation."""
 
+from functools import lru_cache
+
 import numpy as np
 import pandas as pd
+import pytest
 
 from pyutss.engine.universe import UniverseResolver
 
+# Keep these tests on one xdist worker so module fixtures build once
+pytestmark = pytest.mark.xdist_group("screener")
+
+
+@lru_cache(maxsize=16)
+def _rand_ohlcv_parts(n: int, seed: int) -> tuple[np.ndarray, ...]:
+    """Random draws behind _make_ohlcv, generated once per (n, seed)."""
+    rng = np.random.default_rng(seed)
+    parts = (
+        rng.normal(0, 1, n),
+        rng.uniform(-0.01, 0.01, n),
+        rng.uniform(0, 0.02, n),
+        rng.uniform(0, 0.02, n),
+        rng.integers(100000, 1000000, n).astype(float),
+    )
+    for arr in parts:
+        arr.setflags(write=False)
+    return parts
+
 
 def _make_ohlcv(n=100, close_start=100.0, seed=42):
     """Create sample OHLCV data."""
-    rng = np.random.default_rng(seed)
+    steps, open_noise, high_noise, low_noise, volume = _rand_ohlcv_parts(n, seed)
     dates = pd.bdate_range("2024-01-01", periods=n)
-    close = close_start + np.cumsum(rng.normal(0, 1, n))
+    close = close_start + np.cumsum(steps)
     close = np.maximum(close, 10)
     return pd.DataFrame(
         {
-            "open": close * (1 + rng.uniform(-0.01, 0.01, n)),
-            "high": close * (1 + rng.uniform(0, 0.02, n)),
-            "low": close * (1 - rng.uniform(0, 0.02, n)),
+            "open": close * (1 + open_noise),
+            "high": close * (1 + high_noise),
+            "low": close * (1 - low_noise),
             "close": close,
-            "volume": rng.integers(100000, 1000000, n).astype(float),
+            "volume": volume.copy(),
         },
         index=dates,
     )
 
 
+def _make_trend(close_start: float, close_end: float, seed: int) -> pd.DataFrame:
+    """Create OHLCV data with a straight-line close from start to end."""
+    data = _make_ohlcv(100, close_start=close_start, seed=seed)
+    data["close"] = np.linspace(close_start, close_end, 100)
+    data["high"] = data["close"] * 1.01
+    data["low"] = data["close"] * 0.99
+    data["open"] = data["close"]
+    return data
+
+
+@pytest.fixture(scope="module")
+def rank_data():
+    """LOW trends down (RSI ~30), HIGH trends up (RSI ~70). Built once per module."""
+    return {
+        "LOW": _make_trend(200, 100, seed=10),
+        "HIGH": _make_trend(100, 200, seed=20),
+    }
+
+
 class TestScreenerFiltering:
     def test_screener_without_data_returns_base(self):
         """Without data, screener returns unfiltered base."""
@@ -37,19 +78,10 @@ class TestScreenerFiltering:
         resolver = UniverseResolver(custom_indices={"TEST": ["UP", "DOWN"]})
 
         # UP: trending up, DOWN: trending down
-        up_data = _make_ohlcv(100, close_start=100, seed=1)
-        up_data["close"] = np.linspace(100, 200, 100)
-        up_data["high"] = up_data["close"] * 1.01
-        up_data["low"] = up_data["close"] * 0.99
-        up_data["open"] = up_data["close"]
-
-        down_data = _make_ohlcv(100, close_start=200, seed=2)
-        down_data["close"] = np.linspace(200, 50, 100)
-        down_data["high"] = down_data["close"] * 1.01
-        down_data["low"] = down_data["close"] * 0.99
-        down_data["open"] = down_data["close"]
-
-        data = {"UP": up_data, "DOWN": down_data}
+        data = {
+            "UP": _make_trend(100, 200, seed=1),
+            "DOWN": _make_trend(200, 50, seed=2),
+        }
 
         # Filter: RSI > 50 (UP should pass since it trends up)
         universe = {
@@ -77,65 +109,22 @@ class TestScreenerFiltering:
         symbols = resolver.resolve(universe)
         assert len(symbols) == 2
 
-    def test_screener_rank_by(self):
-        """Symbols are ranked by the rank_by signal."""
-        resolver = UniverseResolver(custom_indices={"TEST": ["LOW", "HIGH"]})
-
-        # LOW has RSI ~30, HIGH has RSI ~70
-        low_data = _make_ohlcv(100, close_start=200, seed=10)
-        low_data["close"] = np.linspace(200, 100, 100)
-        low_data["high"] = low_data["close"] * 1.01
-        low_data["low"] = low_data["close"] * 0.99
-        low_data["open"] = low_data["close"]
-
-        high_data = _make_ohlcv(100, close_start=100, seed=20)
-        high_data["close"] = np.linspace(100, 200, 100)
-        high_data["high"] = high_data["close"] * 1.01
-        high_data["low"] = high_data["close"] * 0.99
-        high_data["open"] = high_data["close"]
-
-        data = {"LOW": low_data, "HIGH": high_data}
-
-        # Rank by RSI desc — HIGH should come first
-        universe = {
-            "type": "screener",
-            "base": "TEST",
-            "rank_by": {"type": "indicator", "indicator": "RSI", "params": {"period": 14}},
-            "order": "desc",
-        }
-
-        symbols = resolver.resolve(universe, data=data)
-        assert len(symbols) == 2
-        assert symbols[0] == "HIGH"
-        assert symbols[1] == "LOW"
-
-    def test_screener_rank_asc(self):
-        """Ascending rank order returns lowest first."""
+    @pytest.mark.parametrize(
+        ("order", "expected"),
+        [("desc", ["HIGH", "LOW"]), ("asc", ["LOW", "HIGH"])],
+    )
+    def test_screener_rank_order(self, rank_data, order, expected):
+        """Symbols are ranked by the rank_by signal in the requested order."""
         resolver = UniverseResolver(custom_indices={"TEST": ["LOW", "HIGH"]})
-
-        low_data = _make_ohlcv(100, close_start=200, seed=10)
-        low_data["close"] = np.linspace(200, 100, 100)
-        low_data["high"] = low_data["close"] * 1.01
-        low_data["low"] = low_data["close"] * 0.99
-        low_data["open"] = low_data["close"]
-
-        high_data = _make_ohlcv(100, close_start=100, seed=20)
-        high_data["close"] = np.linspace(100, 200, 100)
-        high_data["high"] = high_data["close"] * 1.01
-        high_data["low"] = high_data["close"] * 0.99
-        high_data["open"] = high_data["close"]
-
-        data = {"LOW": low_data, "HIGH": high_data}
-
         universe = {
             "type": "screener",
             "base": "TEST",
             "rank_by": {"type": "indicator", "indicator": "RSI", "params": {"period": 14}},
-            "order": "asc",
+            "order": order,
         }
 
-        symbols = resolver.resolve(universe, data=data)
-        assert symbols[0] == "LOW"
+        symbols = resolver.resolve(universe, data=rank_data)
+        assert symbols == expected
 
     def test_screener_missing_data_symbols_skipped(self):
         """Symbols without data are skipped during filtering."""
@@ -159,3 +159,10 @@ class TestRoundToLot:
     def test_zero_quantity(self):
         """Zero quantity stays zero."""
         assert round_to_lot(0, lot_size=100) == 0.0
+
+    def test_negative_and_fractional_round_down(self):
+        """Negative and fractional quantities floor rather than truncate."""
+        assert round_to_lot(-5.5, lot_size=1) == -6
+        assert isinstance(round_to_lot(5.5, lot_size=1), int)
+        assert round_to_lot(-50.5, lot_size=100) == -100.0
+        assert round_to_lot(199.9, lot_size=100) == 100.0
@@ -7,10 +7,29 @@ from pyutss.data.sources import (
     Ticker,
     _detect_market,
     _get_source_for_symbol,
+    _installed_sources,
     available_sources,
 )
 
 
+@pytest.fixture(scope="module")
+def aapl_ticker():
+    """Auto-detected Ticker for AAPL, built once per module."""
+    try:
+        return Ticker("AAPL")
+    except ImportError:
+        pytest.skip("No data sources installed")
+
+
+@pytest.fixture(scope="module")
+def jp_yahoo_ticker():
+    """Yahoo-backed Ticker for a JP symbol, built once per module."""
+    try:
+        return Ticker("7203", source="yahoo")
+    except ImportError:
+        pytest.skip("yfinance not installed")
+
+
 class TestSourcesConfig:
     """Tests for source configuration."""
 
@@ -89,18 +108,27 @@ class TestAvailableSources:
         for source in sources:
             assert source in SOURCES
 
+    def test_available_sources_cached(self):
+        """available_sources should probe imports once and reuse the result."""
+        _installed_sources.cache_clear()
+        first = available_sources()
+        assert available_sources() == first
+        assert _installed_sources.cache_info().hits >= 1
+
+    def test_available_sources_returns_fresh_list(self):
+        """Mutating the returned list must not affect later calls."""
+        sources = available_sources()
+        sources.append("bogus")
+        assert "bogus" not in available_sources()
+
 
 class TestTickerClass:
     """Tests for Ticker class."""
 
-    def test_ticker_creation_us(self):
+    def test_ticker_creation_us(self, aapl_ticker):
         """Ticker should be created for US symbols."""
-        try:
-            ticker = Ticker("AAPL")
-            assert ticker.symbol == "AAPL"
-            assert ticker.source in ["yahoo", "jquants"]
-        except ImportError:
-            pytest.skip("No data sources installed")
+        assert aapl_ticker.symbol == "AAPL"
+        assert aapl_ticker.source in ["yahoo", "jquants"]
 
     def test_ticker_creation_jp(self):
         """Ticker should be created for JP symbols."""
@@ -119,24 +147,16 @@ class TestTickerClass:
         except ImportError:
             pytest.skip("yfinance not installed")
 
-    def test_ticker_repr(self):
+    def test_ticker_repr(self, aapl_ticker):
         """Ticker repr should show symbol and source."""
-        try:
-            ticker = Ticker("AAPL")
-            repr_str = repr(ticker)
-            assert "AAPL" in repr_str
-            assert ticker.source in repr_str
-        except ImportError:
-            pytest.skip("No data sources installed")
+        repr_str = repr(aapl_ticker)
+        assert "AAPL" in repr_str
+        assert aapl_ticker.source in repr_str
 
-    def test_ticker_normalize_jp_for_yahoo(self):
+    def test_ticker_normalize_jp_for_yahoo(self, jp_yahoo_ticker):
         """Ticker should normalize JP symbols for Yahoo."""
-        try:
-            ticker = Ticker("7203", source="yahoo")
-            # Yahoo expects .T suffix for Japanese stocks
-            assert ticker._normalize_symbol() == "7203.T"
-        except ImportError:
-            pytest.skip("yfinance not installed")
+        # Yahoo expects .T suffix for Japanese stocks
+        assert jp_yahoo_ticker._normalize_symbol() == "7203.T"
 
     def test_ticker_normalize_jp_for_jquants(self):
         """Ticker should normalize JP symbols for J-Quants."""
@@ -1,6 +1,7 @@
 """Tests for visualization module."""
 
 from datetime import date
+from importlib.util import find_spec
 
 import numpy as np
 import pandas as pd
@@ -8,6 +9,13 @@ import pytest
 
 from pyutss.results.types import BacktestResult, PortfolioSnapshot, Trade
 
+# Optional plotting dependencies, probed once without importing them
+requires_matplotlib = pytest.mark.skipif(
+    find_spec("matplotlib") is None, reason="matplotlib not installed"
+)
+requires_seaborn = pytest.mark.skipif(find_spec("seaborn") is None, reason="seaborn not installed")
+requires_scipy = pytest.mark.skipif(find_spec("scipy") is None, reason="scipy not installed")
+
 
 def create_sample_result() -> BacktestResult:
     """Create a sample BacktestResult for testing."""
@@ -65,17 +73,20 @@ def create_sample_result() -> BacktestResult:
     ]
 
     # Create portfolio history
-    history = []
-    for i, (dt, eq) in enumerate(zip(dates, equity)):
-        d = dt.date() if hasattr(dt, "date") else dt
-        history.append(PortfolioSnapshot(
-            date=d,
+    running_max = np.maximum.accumulate(equity)
+    drawdown = np.maximum(0, running_max - equity)
+    drawdown_pct = np.maximum(0, (1 - equity / running_max) * 100)
+    history = [
+        PortfolioSnapshot(
+            date=dt.date(),
             cash=eq * 0.3,
             positions_value=eq * 0.7,
             equity=eq,
-            drawdown=max(0, equity[:i+1].max() - eq),
-            drawdown_pct=max(0, (1 - eq / equity[:i+1].max()) * 100),
-        ))
+            drawdown=float(dd),
+            drawdown_pct=float(dd_pct),
+        )
+        for dt, eq, dd, dd_pct in zip(dates, equity, drawdown, drawdown_pct)
+    ]
 
     return BacktestResult(
         strategy_id="test_strategy",
@@ -90,26 +101,30 @@ def create_sample_result() -> BacktestResult:
     )
 
 
+@pytest.fixture(scope="module")
+def sample_result() -> BacktestResult:
+    """Sample result shared by every test in the module; treat as read-only."""
+    return create_sample_result()
+
+
 class TestTearSheet:
     """Tests for TearSheet class."""
 
-    def test_init(self):
+    def test_init(self, sample_result):
         """Test TearSheet initialization."""
         from pyutss.visualization import TearSheet
 
-        result = create_sample_result()
-        sheet = TearSheet(result)
+        sheet = TearSheet(sample_result)
 
-        assert sheet.result is result
+        assert sheet.result is sample_result
         assert sheet.benchmark is None
         assert sheet.risk_free_rate == 0.0
 
-    def test_summary_stats(self):
+    def test_summary_stats(self, sample_result):
         """Test summary statistics calculation."""
         from pyutss.visualization import TearSheet
 
-        result = create_sample_result()
-        sheet = TearSheet(result)
+        sheet = TearSheet(sample_result)
         stats = sheet.summary_stats()
 
         assert "Total Return (%)" in stats
@@ -118,12 +133,11 @@ class TestTearSheet:
         assert "Win Rate (%)" in stats
         assert "Total Trades" in stats
 
-    def test_summary_table(self):
+    def test_summary_table(self, sample_result):
         """Test summary table generation."""
         from pyutss.visualization import TearSheet
 
-        result = create_sample_result()
-        sheet = TearSheet(result)
+        sheet = TearSheet(sample_result)
         df = sheet.summary_table()
 
         assert isinstance(df, pd.DataFrame)
@@ -131,12 +145,11 @@ class TestTearSheet:
         assert "Value" in df.columns
         assert len(df) > 0
 
-    def test_metrics_cached(self):
+    def test_metrics_cached(self, sample_result):
         """Test that metrics are cached."""
         from pyutss.visualization import TearSheet
 
-        result = create_sample_result()
-        sheet = TearSheet(result)
+        sheet = TearSheet(sample_result)
 
         metrics1 = sheet.metrics
         metrics2 = sheet.metrics
@@ -144,16 +157,32 @@ class TestTearSheet:
         assert metrics1 is metrics2
 
 
+@pytest.fixture(scope="module")
+def shared_figure():
+    """One headless Figure reused by chart tests instead of one per test."""
+    import matplotlib
+
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    fig = plt.figure()
+    yield fig
+    plt.close(fig)
+
+
+@pytest.fixture
+def chart_ax(shared_figure):
+    """Fresh axes on the shared figure, cleared between tests."""
+    shared_figure.clf()
+    return shared_figure.add_subplot()
+
+
+@requires_matplotlib
 class TestCharts:
     """Tests for chart generation functions."""
 
-    @pytest.fixture
-    def sample_result(self):
-        return create_sample_result()
-
     def test_plot_equity_curve(self, sample_result):
         """Test equity curve plot generation."""
-        pytest.importorskip("matplotlib")
         from pyutss.visualization import plot_equity_curve
 
         fig = plot_equity_curve(sample_result)
@@ -162,66 +191,45 @@ class TestCharts:
         import matplotlib.pyplot as plt
         plt.close(fig)
 
-    def test_plot_equity_curve_no_drawdown(self, sample_result):
+    def test_plot_equity_curve_no_drawdown(self, sample_result, chart_ax):
         """Test equity curve without drawdown."""
-        pytest.importorskip("matplotlib")
         from pyutss.visualization import plot_equity_curve
 
-        fig = plot_equity_curve(sample_result, show_drawdown=False)
-        assert fig is not None
-
-        import matplotlib.pyplot as plt
-        plt.close(fig)
+        fig = plot_equity_curve(sample_result, ax=chart_ax, show_drawdown=False)
+        assert fig is chart_ax.figure
 
-    def test_plot_drawdown(self, sample_result):
+    def test_plot_drawdown(self, sample_result, chart_ax):
         """Test drawdown plot generation."""
-        pytest.importorskip("matplotlib")
         from pyutss.visualization import plot_drawdown
 
-        fig = plot_drawdown(sample_result)
-        assert fig is not None
-
-        import matplotlib.pyplot as plt
-        plt.close(fig)
+        fig = plot_drawdown(sample_result, ax=chart_ax)
+        assert fig is chart_ax.figure
 
-    def test_plot_monthly_heatmap(self, sample_result):
+    @requires_seaborn
+    def test_plot_monthly_heatmap(self, sample_result, chart_ax):
         """Test monthly heatmap generation."""
-        pytest.importorskip("matplotlib")
-        pytest.importorskip("seaborn")
         from pyutss.visualization import plot_monthly_heatmap
 
-        fig = plot_monthly_heatmap(sample_result)
-        assert fig is not None
-
-        import matplotlib.pyplot as plt
-        plt.close(fig)
+        fig = plot_monthly_heatmap(sample_result, ax=chart_ax)
+        assert fig is chart_ax.figure
 
-    def test_plot_rolling_metrics(self, sample_result):
+    def test_plot_rolling_metrics(self, sample_result, chart_ax):
         """Test rolling metrics plot generation."""
-        pytest.importorskip("matplotlib")
         from pyutss.visualization import plot_rolling_metrics
 
-        fig = plot_rolling_metrics(sample_result)
-        assert fig is not None
-
-        import matplotlib.pyplot as plt
-        plt.close(fig)
+        fig = plot_rolling_metrics(sample_result, ax=chart_ax)
+        assert fig is chart_ax.figure
 
-    def test_plot_distribution(self, sample_result):
+    @requires_scipy
+    def test_plot_distribution(self, sample_result, chart_ax):
         """Test distribution plot generation."""
-        pytest.importorskip("matplotlib")
-        pytest.importorskip("scipy")
         from pyutss.visualization import plot_distribution
 
-        fig = plot_distribution(sample_result)
-        assert fig is not None
-
-        import matplotlib.pyplot as plt
-        plt.close(fig)
+        fig = plot_distribution(sample_result, ax=chart_ax)
+        assert fig is chart_ax.figure
 
     def test_plot_trade_analysis(self, sample_result):
         """Test trade analysis plot generation."""
-        pytest.importorskip("matplotlib")
         from pyutss.visualization import plot_trade_analysis
 
         fig = plot_trade_analysis(sample_result)
@@ -231,19 +239,17 @@ class TestCharts:
         plt.close(fig)
 
 
+@requires_matplotlib
 class TestHTMLReport:
     """Tests for HTML report generation."""
 
-    def test_full_report_generation(self, tmp_path):
+    @requires_seaborn
+    @requires_scipy
+    def test_full_report_generation(self, sample_result, tmp_path):
         """Test full HTML report generation."""
-        pytest.importorskip("matplotlib")
-        pytest.importorskip("seaborn")
-        pytest.importorskip("scipy")
-
         from pyutss.visualization import TearSheet
 
-        result = create_sample_result()
-        sheet = TearSheet(result)
+        sheet = TearSheet(sample_result)
 
         output_path = tmp_path / "report.html"
         sheet.full_report(str(output_path))
@@ -41,6 +41,9 @@ class TestGetWeightScheme:
         scheme = get_weight_scheme("risk_parity")
         assert isinstance(scheme, WeightScheme)
 
+    def test_string_schemes_are_shared(self):
+        assert get_weight_scheme("risk_parity") is get_weight_scheme("risk_parity")
+
     def test_string_unknown_defaults_to_equal(self):
         scheme = get_weight_scheme("unknown_scheme")
         assert isinstance(scheme, EqualWeight)
@@ -5,20 +5,26 @@ Convert natural language descriptions into validated UTSS strategies.
 Supports both one-shot parsing and interactive conversation-based building.
 """
 
-# Conversation module
-from utss_llm.conversation import (
-    ConversationResponse,
-    ConversationSession,
-    ConversationState,
-    Option,
-    Question,
-    ResponseType,
-    SessionManager,
-    create_session,
-    get_session,
-)
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from utss_llm.parser import ParseMode, ParseResult, StrategyParser
 
+if TYPE_CHECKING:
+    from utss_llm.conversation import (
+        ConversationResponse,
+        ConversationSession,
+        ConversationState,
+        Option,
+        Question,
+        ResponseType,
+        SessionManager,
+        create_session,
+        get_session,
+    )
+
 __version__ = "0.1.1"
 
 __all__ = [
@@ -37,3 +43,19 @@ __all__ = [
     "create_session",
     "get_session",
 ]
+
+# Conversation names are loaded on first access so one-shot parser users
+# don't import the conversation stack (builder, session, state).
+_CONVERSATION_EXPORTS = frozenset(__all__) - {"StrategyParser", "ParseResult", "ParseMode"}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _CONVERSATION_EXPORTS:
+        value = getattr(importlib.import_module("utss_llm.conversation"), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | _CONVERSATION_EXPORTS)
@@ -1,5 +1,7 @@
 """Strategy builder with guided flow logic."""
 
+from collections.abc import Callable
+
 from utss_llm.conversation.questions import QUESTION_STRATEGY_TYPE
 from utss_llm.conversation.state import (
     ConversationResponse,
@@ -20,6 +22,28 @@ from utss_llm.conversation.steps import (
     handle_universe_type,
 )
 
+# Step name -> handler, shared by every builder instance
+_STEP_HANDLERS: dict[str, Callable[[ConversationState, str], ConversationResponse]] = {
+    "strategy_type": handle_strategy_type,
+    "universe_type": handle_universe_type,
+    "universe_details": handle_universe_details,
+    "entry_indicator": handle_entry_indicator,
+    "entry_params": handle_entry_params,
+    "exit_params": handle_exit_params,
+    "position_size": handle_position_size,
+    "stop_loss": handle_stop_loss,
+    "take_profit": handle_take_profit,
+    "max_positions": handle_max_positions,
+    "confirm": handle_confirm,
+}
+
+# Responses are immutable, so the static opening question is built once
+_INITIAL_RESPONSE = ConversationResponse(
+    type=ResponseType.QUESTION,
+    message="Let's build your trading strategy step by step.",
+    question=QUESTION_STRATEGY_TYPE,
+)
+
 
 class StrategyBuilder:
     """Guided strategy building flow.
@@ -30,27 +54,11 @@ class StrategyBuilder:
 
     def __init__(self) -> None:
         """Initialize the strategy builder."""
-        self._step_handlers = {
-            "strategy_type": handle_strategy_type,
-            "universe_type": handle_universe_type,
-            "universe_details": handle_universe_details,
-            "entry_indicator": handle_entry_indicator,
-            "entry_params": handle_entry_params,
-            "exit_params": handle_exit_params,
-            "position_size": handle_position_size,
-            "stop_loss": handle_stop_loss,
-            "take_profit": handle_take_profit,
-            "max_positions": handle_max_positions,
-            "confirm": handle_confirm,
-        }
+        self._step_handlers = _STEP_HANDLERS
 
     def get_initial_question(self) -> ConversationResponse:
         """Get the first question to start the flow."""
-        return ConversationResponse(
-            type=ResponseType.QUESTION,
-            message="Let's build your trading strategy step by step.",
-            question=QUESTION_STRATEGY_TYPE,
-        )
+        return _INITIAL_RESPONSE
 
     def process_answer(
         self,
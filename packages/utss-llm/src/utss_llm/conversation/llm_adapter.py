@@ -7,20 +7,37 @@ LLM-powered revision, and JSON extraction from LLM responses.
 import json
 import logging
 import re
+from collections.abc import Callable
 from typing import Any
 
-import yaml
-
-logger = logging.getLogger(__name__)
-
+from utss_llm.conversation.questions import (
+    QUESTION_CONFIRM,
+    QUESTION_POSITION_SIZE,
+    QUESTION_SYMBOLS,
+    QUESTION_UNIVERSE_TYPE,
+    STRATEGY_TYPE_NAMES,
+)
 from utss_llm.conversation.state import (
     ConversationResponse,
     ConversationState,
     PartialStrategy,
     ResponseType,
 )
+from utss_llm.conversation.steps import (
+    dump_strategy_yaml,
+    get_entry_indicator_question,
+    get_entry_params_question,
+    get_exit_params_question,
+)
 from utss_llm.providers.base import LLMProvider
 
+logger = logging.getLogger(__name__)
+
+# JSON inside a fenced code block (the gap after the tag stays on one line to
+# avoid quadratic backtracking on unterminated blocks)
+_CODEBLOCK_RE = re.compile(r"```(?:json)?[^\S\n]*\n?(.*?)```", re.DOTALL)
+_JSON_DECODER = json.JSONDecoder()
+
 
 # Prompt for extracting strategy info from natural language
 SMART_START_PROMPT = """Analyze this trading strategy description and extract key information.
@@ -76,37 +93,87 @@ Return ONLY a JSON object with the fields to change:
 ```
 Only include fields that need to change. Use null for unchanged fields."""
 
+# REVISION_PROMPT listing only the configured fields, to keep llm_revise()
+# prompts short
+_COMPACT_REVISION_PROMPT = """Given the current strategy and a revision instruction, determine what changes to make.
+
+Current Strategy Summary:
+{summary}
+
+Revision instruction: "{instruction}"
+
+Identify what field(s) to update and their new value(s).
+Return ONLY a JSON object with the fields to change:
+```json
+{{
+  "entry_threshold": ...,
+  "exit_threshold": ...,
+  "stop_loss_pct": ...,
+  "sizing_value": ...,
+  "entry_indicator": ...,
+  "exit_indicator": ...
+}}
+```
+Only include fields that need to change. Use null for unchanged fields."""
+
+# (label, PartialStrategy attribute, unit) for the revision prompt summary
+_REVISION_SUMMARY_FIELDS = (
+    ("Entry indicator", "entry_indicator", ""),
+    ("Entry threshold", "entry_threshold", ""),
+    ("Exit indicator", "exit_indicator", ""),
+    ("Exit threshold", "exit_threshold", ""),
+    ("Stop loss", "stop_loss_pct", "%"),
+    ("Position size", "sizing_value", "%"),
+)
+
+
+def _revision_summary(strategy: PartialStrategy) -> str:
+    """Summarize the configured fields, leaving out unset ones to save tokens."""
+    lines = [
+        f"- {label}: {value}{unit}"
+        for label, attr, unit in _REVISION_SUMMARY_FIELDS
+        if (value := getattr(strategy, attr))
+    ]
+    return "\n".join(lines) or "- Nothing configured yet"
+
 
 def extract_json(content: str) -> dict[str, Any] | None:
     """Extract JSON from LLM response.
 
     Tries multiple strategies:
-    1. JSON in code blocks (```json ... ```)
-    2. Entire content as JSON
-    3. First JSON object pattern in content
+    1. Entire content as JSON (the usual reply to a "return only JSON" prompt)
+    2. JSON in code blocks (```json ... ```)
+    3. First complete JSON object embedded in the content
     """
-    # Try to find JSON in code blocks
-    json_match = re.search(r"```(?:json)?\s*\n?(.*?)```", content, re.DOTALL)
-    if json_match:
-        try:
-            return json.loads(json_match.group(1).strip())
-        except json.JSONDecodeError:
-            pass
-
     # Try parsing entire content as JSON
     try:
         return json.loads(content.strip())
-    except json.JSONDecodeError:
+    except (ValueError, RecursionError):
         pass
 
-    # Try to find JSON object pattern
-    json_obj_match = re.search(r"\{[^{}]*\}", content, re.DOTALL)
-    if json_obj_match:
+    if "{" not in content:
+        return None
+
+    # Try to find JSON in code blocks
+    json_match = _CODEBLOCK_RE.search(content)
+    if json_match:
         try:
-            return json.loads(json_obj_match.group(0))
-        except json.JSONDecodeError:
+            return json.loads(json_match.group(1).strip())
+        except (ValueError, RecursionError):
             pass
 
+    # Decode the first complete object embedded in surrounding prose
+    start = content.find("{")
+    while start != -1:
+        try:
+            obj, _ = _JSON_DECODER.raw_decode(content, start)
+            return obj
+        except ValueError:
+            start = content.find("{", start + 1)
+        except RecursionError:
+            # Too deeply nested; retrying at each inner "{" would be quadratic
+            return None
+
     return None
 
 
@@ -152,13 +219,8 @@ async def llm_revise(
 
     Falls back to keyword_revise_fn on any LLM error.
     """
-    prompt = REVISION_PROMPT.format(
-        entry_indicator=strategy.entry_indicator or "N/A",
-        entry_threshold=strategy.entry_threshold or "N/A",
-        exit_indicator=strategy.exit_indicator or "N/A",
-        exit_threshold=strategy.exit_threshold or "N/A",
-        stop_loss=strategy.stop_loss_pct or "N/A",
-        position_size=strategy.sizing_value or "N/A",
+    prompt = _COMPACT_REVISION_PROMPT.format(
+        summary=_revision_summary(strategy),
         instruction=instruction,
     )
 
@@ -206,27 +268,18 @@ def prefill_strategy(strategy: PartialStrategy, extracted: dict[str, Any]) -> No
     """Pre-fill partial strategy from extracted info."""
     # Strategy type
     strategy_type = extracted.get("strategy_type")
-    if strategy_type:
-        type_names = {
-            "mean_reversion": ("Mean Reversion Strategy", "Buy when oversold, sell when overbought"),
-            "trend_following": (
-                "Trend Following Strategy",
-                "Follow the direction of the market trend",
-            ),
-            "breakout": ("Breakout Strategy", "Trade when price breaks key levels"),
-            "calendar": ("Calendar Strategy", "Trade based on calendar patterns"),
-        }
-        if strategy_type in type_names:
-            strategy.name, strategy.description = type_names[strategy_type]
+    if strategy_type in STRATEGY_TYPE_NAMES:
+        strategy.name, strategy.description = STRATEGY_TYPE_NAMES[strategy_type]
 
     # Indicators
     indicators = extracted.get("indicators", [])
-    if indicators and len(indicators) > 0:
-        strategy.entry_indicator = indicators[0].upper()
+    if indicators:
+        entry_indicator = indicators[0].upper()
+        strategy.entry_indicator = entry_indicator
         if len(indicators) > 1:
             strategy.exit_indicator = indicators[1].upper()
         else:
-            strategy.exit_indicator = indicators[0].upper()
+            strategy.exit_indicator = entry_indicator
 
     # Thresholds
     if extracted.get("entry_threshold") is not None:
@@ -252,78 +305,95 @@ def prefill_strategy(strategy: PartialStrategy, extracted: dict[str, Any]) -> No
         strategy.sizing_value = float(extracted["position_size"])
 
 
-def skip_to_unanswered(
-    state: ConversationState,
-    builder: "StrategyBuilder",  # noqa: F821
-) -> ConversationResponse:
-    """Find the first unanswered question and skip to it."""
-    strategy = state.partial_strategy
+def _ask_universe_type(state: ConversationState, builder: Any) -> ConversationResponse:
+    return ConversationResponse(
+        type=ResponseType.QUESTION,
+        message=f"I understand you want a {state.partial_strategy.name}. Let's configure it.",
+        question=QUESTION_UNIVERSE_TYPE,
+    )
 
-    # Check what's filled and advance state accordingly
-    if strategy.name is None:
-        state.current_step = "strategy_type"
-        return builder.get_initial_question()
 
-    if strategy.universe_type is None:
-        state.current_step = "universe_type"
-        from utss_llm.conversation.questions import QUESTION_UNIVERSE_TYPE
+def _ask_symbols(state: ConversationState, builder: Any) -> ConversationResponse:
+    return ConversationResponse(
+        type=ResponseType.QUESTION,
+        message="Which symbols would you like to trade?",
+        question=QUESTION_SYMBOLS,
+    )
 
-        return ConversationResponse(
-            type=ResponseType.QUESTION,
-            message=f"I understand you want a {strategy.name}. Let's configure it.",
-            question=QUESTION_UNIVERSE_TYPE,
-        )
 
-    if strategy.universe_type == "static" and not strategy.symbols:
-        state.current_step = "universe_details"
-        from utss_llm.conversation.questions import QUESTION_SYMBOLS
+def _ask_entry_indicator(state: ConversationState, builder: Any) -> ConversationResponse:
+    return ConversationResponse(
+        type=ResponseType.QUESTION,
+        message="Which indicator should trigger entries?",
+        question=get_entry_indicator_question(state),
+    )
 
-        return ConversationResponse(
-            type=ResponseType.QUESTION,
-            message="Which symbols would you like to trade?",
-            question=QUESTION_SYMBOLS,
-        )
 
-    if strategy.entry_indicator is None:
-        state.current_step = "entry_indicator"
-        return ConversationResponse(
-            type=ResponseType.QUESTION,
-            message="Which indicator should trigger entries?",
-            question=builder._get_entry_indicator_question(state),
-        )
+def _ask_entry_params(state: ConversationState, builder: Any) -> ConversationResponse:
+    indicator = state.partial_strategy.entry_indicator
+    return ConversationResponse(
+        type=ResponseType.QUESTION,
+        message=f"At what {indicator} level should we enter?",
+        question=get_entry_params_question(indicator),
+    )
 
-    if strategy.entry_threshold is None:
-        state.current_step = "entry_params"
-        return ConversationResponse(
-            type=ResponseType.QUESTION,
-            message=f"At what {strategy.entry_indicator} level should we enter?",
-            question=builder._get_entry_params_question(strategy.entry_indicator),
-        )
 
-    if strategy.exit_threshold is None:
-        state.current_step = "exit_params"
-        return ConversationResponse(
-            type=ResponseType.QUESTION,
-            message=f"At what {strategy.exit_indicator} level should we exit?",
-            question=builder._get_exit_params_question(strategy.exit_indicator),
-        )
+def _ask_exit_params(state: ConversationState, builder: Any) -> ConversationResponse:
+    indicator = state.partial_strategy.exit_indicator
+    return ConversationResponse(
+        type=ResponseType.QUESTION,
+        message=f"At what {indicator} level should we exit?",
+        question=get_exit_params_question(indicator),
+    )
 
-    if strategy.sizing_value is None:
-        state.current_step = "position_size"
-        from utss_llm.conversation.questions import QUESTION_POSITION_SIZE
 
-        return ConversationResponse(
-            type=ResponseType.QUESTION,
-            message="How should we size positions?",
-            question=QUESTION_POSITION_SIZE,
-        )
+def _ask_position_size(state: ConversationState, builder: Any) -> ConversationResponse:
+    return ConversationResponse(
+        type=ResponseType.QUESTION,
+        message="How should we size positions?",
+        question=QUESTION_POSITION_SIZE,
+    )
+
+
+# Steps in flow order: (step, "still unanswered" predicate, response builder).
+# The first step whose predicate holds is asked next.
+_SKIP_CHECKS: list[
+    tuple[
+        str,
+        Callable[[PartialStrategy], bool],
+        Callable[[ConversationState, Any], ConversationResponse],
+    ]
+] = [
+    ("strategy_type", lambda s: s.name is None, lambda state, b: b.get_initial_question()),
+    ("universe_type", lambda s: s.universe_type is None, _ask_universe_type),
+    (
+        "universe_details",
+        lambda s: s.universe_type == "static" and not s.symbols,
+        _ask_symbols,
+    ),
+    ("entry_indicator", lambda s: s.entry_indicator is None, _ask_entry_indicator),
+    ("entry_params", lambda s: s.entry_threshold is None, _ask_entry_params),
+    ("exit_params", lambda s: s.exit_threshold is None, _ask_exit_params),
+    ("position_size", lambda s: s.sizing_value is None, _ask_position_size),
+]
+
+
+def skip_to_unanswered(
+    state: ConversationState,
+    builder: "StrategyBuilder",  # noqa: F821
+) -> ConversationResponse:
+    """Find the first unanswered question and skip to it."""
+    strategy = state.partial_strategy
+
+    for step, is_unanswered, respond in _SKIP_CHECKS:
+        if is_unanswered(strategy):
+            state.current_step = step
+            return respond(state, builder)
 
     # If we have enough info, show preview
     state.current_step = "confirm"
     strategy_dict = strategy.to_utss_dict()
-    preview = yaml.dump(strategy_dict, default_flow_style=False, sort_keys=False)
-
-    from utss_llm.conversation.questions import QUESTION_CONFIRM
+    preview = dump_strategy_yaml(state, strategy_dict)
 
     return ConversationResponse(
         type=ResponseType.CONFIRMATION,
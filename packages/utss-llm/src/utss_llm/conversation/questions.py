@@ -5,26 +5,27 @@ from utss_llm.conversation.state import Option, Question
 # =============================================================================
 # Indicator Options
 # =============================================================================
+# Tuples: these are shared by the module-level questions across sessions.
 
-MOMENTUM_INDICATORS = [
+MOMENTUM_INDICATORS = (
     Option(id="RSI", label="RSI", description="Relative Strength Index (0-100)", value="RSI"),
     Option(id="STOCH", label="Stochastic", description="Stochastic Oscillator", value="STOCH_K"),
     Option(id="WILLIAMS_R", label="Williams %R", description="Williams Percent Range", value="WILLIAMS_R"),
     Option(id="MFI", label="MFI", description="Money Flow Index", value="MFI"),
     Option(id="CCI", label="CCI", description="Commodity Channel Index", value="CCI"),
-]
+)
 
-TREND_INDICATORS = [
+TREND_INDICATORS = (
     Option(id="SMA", label="SMA", description="Simple Moving Average", value="SMA"),
     Option(id="EMA", label="EMA", description="Exponential Moving Average", value="EMA"),
     Option(id="MACD", label="MACD", description="Moving Average Convergence Divergence", value="MACD"),
     Option(id="ADX", label="ADX", description="Average Directional Index", value="ADX"),
-]
+)
 
-VOLATILITY_INDICATORS = [
+VOLATILITY_INDICATORS = (
     Option(id="BB", label="Bollinger Bands", description="Bollinger Bands %B", value="BB"),
     Option(id="ATR", label="ATR", description="Average True Range", value="ATR"),
-]
+)
 
 ALL_INDICATORS = MOMENTUM_INDICATORS + TREND_INDICATORS + VOLATILITY_INDICATORS
 
@@ -61,6 +62,14 @@ QUESTION_STRATEGY_TYPE = Question(
     allow_custom=True,
 )
 
+# Strategy type id -> (strategy name, description)
+STRATEGY_TYPE_NAMES: dict[str, tuple[str, str]] = {
+    "mean_reversion": ("Mean Reversion Strategy", "Buy when oversold, sell when overbought"),
+    "trend_following": ("Trend Following Strategy", "Follow the direction of the market trend"),
+    "breakout": ("Breakout Strategy", "Trade when price breaks key levels"),
+    "calendar": ("Calendar Strategy", "Trade based on calendar patterns"),
+}
+
 
 # =============================================================================
 # Universe Questions
@@ -3,11 +3,10 @@
 import re
 import time
 import uuid
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from typing import Any
 
-import yaml
-
 from utss_llm.conversation.builder import StrategyBuilder
 from utss_llm.conversation.llm_adapter import (
     llm_revise,
@@ -18,9 +17,44 @@ from utss_llm.conversation.state import (
     ConversationState,
     ResponseType,
 )
+from utss_llm.conversation.steps import dump_strategy_yaml
 from utss_llm.parser import ParseMode
 from utss_llm.providers.base import LLMProvider
 
+# StrategyBuilder keeps no per-conversation state, so sessions share one
+_SHARED_BUILDER = StrategyBuilder()
+
+_NUM_RE = re.compile(r"\d+")
+_REVISE_KEYWORD_RE = re.compile(
+    r"(?=(rsi|entry|oversold|exit|overbought|stop|loss|take|profit|position|size|max))",
+    re.IGNORECASE,
+)
+# RSI threshold to revise: first entry whose keywords appear wins
+_RSI_TARGETS = (
+    (frozenset({"entry", "oversold"}), "entry_threshold"),
+    (frozenset({"exit", "overbought"}), "exit_threshold"),
+)
+# Fields revised when all of their keywords appear
+_REVISE_RULES = (
+    (frozenset({"stop", "loss"}), "stop_loss_pct"),
+    (frozenset({"take", "profit"}), "take_profit_pct"),
+    (frozenset({"position", "size"}), "sizing_value"),
+    (frozenset({"max", "position"}), "max_positions"),
+)
+
+# Words that carry no strategy information on their own
+_FILLER_WORDS = frozenset({
+    "a", "an", "begin", "build", "create", "hello", "help", "hey", "hi",
+    "i", "let's", "lets", "make", "me", "new", "ok", "okay", "please",
+    "start", "strategy", "to", "trading", "want", "would", "like",
+})
+
+
+def _is_trivial_prompt(prompt: str) -> bool:
+    """True if the prompt has nothing for the LLM to extract (e.g. "hi")."""
+    words = (w.strip(".,!?").lower() for w in prompt.split())
+    return all(not w or w in _FILLER_WORDS for w in words)
+
 
 @dataclass
 class ConversationSession:
@@ -52,9 +86,9 @@ class ConversationSession:
 
     provider: LLMProvider | None = None
     mode: ParseMode = ParseMode.BEGINNER
-    session_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    session_id: str = field(default_factory=lambda: uuid.uuid4().hex)
     state: ConversationState = field(default_factory=ConversationState)
-    builder: StrategyBuilder = field(default_factory=StrategyBuilder)
+    builder: StrategyBuilder = _SHARED_BUILDER
     use_llm: bool = False  # Whether to use LLM for question generation
     created_at: float = field(default_factory=time.time)
 
@@ -74,7 +108,7 @@ class ConversationSession:
             self.state.add_turn("user", initial_prompt)
 
             # If we have an LLM and want smart parsing, try to extract info
-            if self.use_llm and self.provider:
+            if self.use_llm and self.provider and not _is_trivial_prompt(initial_prompt):
                 return await smart_start(self.provider, initial_prompt, self.state, self.builder)
 
         # Default: return first guided question
@@ -125,7 +159,7 @@ class ConversationSession:
 
         # Generate updated preview
         strategy_dict = self.state.partial_strategy.to_utss_dict()
-        preview = yaml.dump(strategy_dict, default_flow_style=False, sort_keys=False)
+        preview = dump_strategy_yaml(self.state, strategy_dict)
 
         response = ConversationResponse(
             type=ResponseType.PREVIEW,
@@ -138,32 +172,28 @@ class ConversationSession:
 
     def _keyword_revise(self, instruction: str) -> None:
         """Apply keyword-based revision (fallback when no LLM)."""
-        instruction_lower = instruction.lower()
+        # Keywords present anywhere in the instruction (overlapping substrings)
+        hits = {m.group(1).lower() for m in _REVISE_KEYWORD_RE.finditer(instruction)}
+        if not hits:
+            return
+
+        number_match = _NUM_RE.search(instruction)
+        if number_match is None:
+            return
+        number = int(number_match.group())
         strategy = self.state.partial_strategy
 
-        # Extract all numbers from instruction
-        numbers = [int(s) for s in re.findall(r'\d+', instruction)]
-
-        if "rsi" in instruction_lower and numbers:
-            if "entry" in instruction_lower or "oversold" in instruction_lower:
-                strategy.entry_threshold = numbers[0]
-            elif "exit" in instruction_lower or "overbought" in instruction_lower:
-                strategy.exit_threshold = numbers[0]
-            else:
-                # If RSI mentioned but not entry/exit, update entry by default
-                strategy.entry_threshold = numbers[0]
-
-        if "stop" in instruction_lower and "loss" in instruction_lower and numbers:
-            strategy.stop_loss_pct = numbers[0]
-
-        if "take" in instruction_lower and "profit" in instruction_lower and numbers:
-            strategy.take_profit_pct = numbers[0]
-
-        if "position" in instruction_lower and "size" in instruction_lower and numbers:
-            strategy.sizing_value = numbers[0]
+        if "rsi" in hits:
+            # If RSI mentioned but not entry/exit, update entry by default
+            target = next(
+                (attr for keywords, attr in _RSI_TARGETS if not hits.isdisjoint(keywords)),
+                "entry_threshold",
+            )
+            setattr(strategy, target, number)
 
-        if "max" in instruction_lower and "position" in instruction_lower and numbers:
-            strategy.max_positions = numbers[0]
+        for required, attr in _REVISE_RULES:
+            if required <= hits:
+                setattr(strategy, attr, number)
 
     def export(self) -> str | None:
         """Export current strategy as UTSS YAML.
@@ -175,7 +205,7 @@ class ConversationSession:
             return None
 
         strategy_dict = self.state.partial_strategy.to_utss_dict()
-        return yaml.dump(strategy_dict, default_flow_style=False, sort_keys=False)
+        return dump_strategy_yaml(self.state, strategy_dict)
 
     def export_dict(self) -> dict[str, Any] | None:
         """Export current strategy as dictionary.
@@ -194,7 +224,7 @@ class ConversationSession:
             YAML string of current state
         """
         strategy_dict = self.state.partial_strategy.to_utss_dict()
-        return yaml.dump(strategy_dict, default_flow_style=False, sort_keys=False)
+        return dump_strategy_yaml(self.state, strategy_dict)
 
     def _resolve_answer(self, answer: str) -> str:
         """Resolve user answer to option id.
@@ -216,14 +246,8 @@ class ConversationSession:
         except ValueError:
             pass
 
-        # Try matching option id or label
-        answer_lower = answer.lower()
-        for opt in last_question.options:
-            if opt.id.lower() == answer_lower or opt.label.lower() == answer_lower:
-                return opt.id
-
-        # Return as-is for custom input
-        return answer
+        # Try matching option id or label, else return as-is for custom input
+        return last_question.match_option(answer) or answer
 
 
 class SessionManager:
@@ -231,10 +255,16 @@ class SessionManager:
 
     Provides create/get/delete operations for ConversationSession instances.
     A default instance is used by the module-level convenience functions.
+    At most ``max_sessions`` are kept; the least recently used session is
+    evicted when a new one would exceed the limit.
     """
 
-    def __init__(self) -> None:
-        self._sessions: dict[str, ConversationSession] = {}
+    def __init__(self, max_sessions: int = 10_000) -> None:
+        if max_sessions < 1:
+            raise ValueError(f"max_sessions must be at least 1, got {max_sessions}")
+        self.max_sessions = max_sessions
+        # Ordered least- to most-recently used
+        self._sessions: OrderedDict[str, ConversationSession] = OrderedDict()
 
     def create(
         self,
@@ -243,13 +273,18 @@ class SessionManager:
     ) -> ConversationSession:
         """Create a new conversation session."""
         self.cleanup_expired()
+        while len(self._sessions) >= self.max_sessions:
+            self._sessions.popitem(last=False)
         session = ConversationSession(provider=provider, mode=mode)
         self._sessions[session.session_id] = session
         return session
 
     def get(self, session_id: str) -> ConversationSession | None:
         """Get an existing session by ID."""
-        return self._sessions.get(session_id)
+        session = self._sessions.get(session_id)
+        if session is not None:
+            self._sessions.move_to_end(session_id)
+        return session
 
     def delete(self, session_id: str) -> bool:
         """Delete a session."""
@@ -1,9 +1,13 @@
 """Conversation state management for interactive strategy building."""
 
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any
 
+# Spaces and hyphens both become underscores in strategy ids
+_SLUG_TABLE = str.maketrans({" ": "_", "-": "_"})
+
 
 class ResponseType(str, Enum):
     """Type of conversation response."""
@@ -15,7 +19,7 @@ class ResponseType(str, Enum):
     PREVIEW = "preview"  # Showing partial strategy
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Option:
     """A selectable option for a question."""
 
@@ -30,23 +34,42 @@ class Option:
         return self.label
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Question:
     """A question to ask the user."""
 
     id: str
     text: str
-    options: list[Option] = field(default_factory=list)
+    options: Sequence[Option] = field(default_factory=list)
     allow_custom: bool = True  # Allow free-form answer
     multi_select: bool = False  # Allow multiple selections
     default: str | None = None  # Default option id
+    # Casefolded option id/label -> option id, built once per question
+    _option_lookup: dict[str, str] = field(
+        init=False, repr=False, compare=False, default_factory=dict
+    )
+
+    def __post_init__(self) -> None:
+        lookup: dict[str, str] = {}
+        for opt in self.options:
+            # Earlier options win, matching a first-match scan
+            lookup.setdefault(opt.id.casefold(), opt.id)
+            lookup.setdefault(opt.label.casefold(), opt.id)
+        object.__setattr__(self, "_option_lookup", lookup)
 
     @property
     def has_options(self) -> bool:
         return len(self.options) > 0
 
+    def match_option(self, answer: str) -> str | None:
+        """Return the id of the option whose id or label matches ``answer``.
+
+        Matching is case-insensitive (Unicode casefolding).
+        """
+        return self._option_lookup.get(answer.casefold())
+
 
-@dataclass
+@dataclass(slots=True)
 class Turn:
     """A single turn in the conversation."""
 
@@ -56,7 +79,7 @@ class Turn:
     answer_option_id: str | None = None  # If user selected an option
 
 
-@dataclass
+@dataclass(slots=True)
 class PartialStrategy:
     """Strategy being built incrementally."""
 
@@ -209,10 +232,10 @@ class PartialStrategy:
 
     def _slugify(self, text: str) -> str:
         """Convert text to slug format."""
-        return text.lower().replace(" ", "_").replace("-", "_")
+        return text.lower().translate(_SLUG_TABLE)
 
 
-@dataclass
+@dataclass(slots=True)
 class ConversationState:
     """Current state of a strategy-building conversation."""
 
@@ -221,21 +244,32 @@ class ConversationState:
     current_step: str = "initial"  # Track where we are in the flow
     is_complete: bool = False
     error: str | None = None
+    # Last rendered (repr(strategy_dict), yaml) pair, reused while the strategy is unchanged
+    _preview_cache: tuple[str, str] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # Most recent question in history, kept up to date by add_turn
+    _last_question: Question | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        for turn in reversed(self.history):
+            if turn.question is not None:
+                self._last_question = turn.question
+                break
 
     def add_turn(self, role: str, content: str, question: Question | None = None) -> None:
         """Add a turn to the conversation history."""
         self.history.append(Turn(role=role, content=content, question=question))
+        if question is not None:
+            self._last_question = question
 
     @property
     def last_question(self) -> Question | None:
         """Get the last question asked."""
-        for turn in reversed(self.history):
-            if turn.question:
-                return turn.question
-        return None
+        return self._last_question
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ConversationResponse:
     """Response from the conversation session."""
 
@@ -1,5 +1,9 @@
 """Step handler functions for the guided strategy builder flow."""
 
+import re
+from functools import lru_cache, partial
+from typing import Any, TypeVar
+
 import yaml
 
 from utss_llm.conversation.questions import (
@@ -18,6 +22,7 @@ from utss_llm.conversation.questions import (
     QUESTION_SYMBOLS,
     QUESTION_TAKE_PROFIT,
     QUESTION_UNIVERSE_TYPE,
+    STRATEGY_TYPE_NAMES,
     TREND_INDICATORS,
 )
 from utss_llm.conversation.state import (
@@ -28,6 +33,22 @@ from utss_llm.conversation.state import (
     ResponseType,
 )
 
+_T = TypeVar("_T")
+
+# Comma separator together with the whitespace around it
+_SYMBOL_SPLIT_RE = re.compile(r"\s*,\s*")
+
+# Answers (lower-cased) that confirm the final strategy
+_AFFIRMATIVE = frozenset({"yes", "y", "true", "1"})
+
+# LibYAML emitter when PyYAML was built with it; output matches the pure-Python one.
+_dump_yaml = partial(
+    yaml.dump,
+    Dumper=getattr(yaml, "CSafeDumper", yaml.SafeDumper),
+    default_flow_style=False,
+    sort_keys=False,
+)
+
 # Step order (shared with StrategyBuilder.STEPS)
 STEPS = [
     "strategy_type",
@@ -43,36 +64,77 @@ STEPS = [
     "confirm",
 ]
 
+# Successor of each step; the last step maps to itself.
+_NEXT_STEP = dict(zip(STEPS, STEPS[1:] + STEPS[-1:], strict=True))
+
 
 def advance_step(state: ConversationState) -> str:
     """Advance to the next step in the flow."""
-    current_idx = STEPS.index(state.current_step)
-    if current_idx < len(STEPS) - 1:
-        state.current_step = STEPS[current_idx + 1]
+    state.current_step = _NEXT_STEP[state.current_step]
     return state.current_step
 
 
-def _get_entry_indicator_question(state: ConversationState) -> Question:
+def _parse_float(text: str, default: _T) -> float | _T:
+    """Parse a numeric answer, returning ``default`` for anything else."""
+    try:
+        return float(text)
+    except ValueError:
+        return default
+
+
+def _parse_int(text: str, default: _T) -> int | _T:
+    """Parse an integer answer, returning ``default`` for anything else."""
+    try:
+        return int(text)
+    except ValueError:
+        return default
+
+
+def dump_strategy_yaml(state: ConversationState, strategy_dict: dict[str, Any]) -> str:
+    """Render a strategy dict as YAML, reusing the last render if unchanged.
+
+    The cache is keyed on ``repr(strategy_dict)``: a snapshot of the contents
+    that stays correct however the strategy was modified (including in-place
+    edits to its lists and dicts) and costs a fraction of a YAML dump.
+    """
+    key = repr(strategy_dict)
+    cached = state._preview_cache
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    rendered: str = _dump_yaml(strategy_dict)
+    state._preview_cache = (key, rendered)
+    return rendered
+
+
+# Entry indicator questions, shared across conversations (Question is frozen)
+_ENTRY_QUESTION_MOMENTUM = Question(
+    id="entry_indicator",
+    text="Which indicator should trigger your entry?",
+    options=MOMENTUM_INDICATORS,
+    allow_custom=True,
+)
+_ENTRY_QUESTION_TREND = Question(
+    id="entry_indicator",
+    text="Which indicator should trigger your entry?",
+    options=TREND_INDICATORS,
+    allow_custom=True,
+)
+
+
+def get_entry_indicator_question(state: ConversationState) -> Question:
     """Get entry indicator question based on strategy type."""
     strategy_name = state.partial_strategy.name or ""
 
     if "Mean Reversion" in strategy_name:
-        options = MOMENTUM_INDICATORS
+        return _ENTRY_QUESTION_MOMENTUM
     elif "Trend" in strategy_name:
-        options = TREND_INDICATORS
-    else:
-        options = QUESTION_ENTRY_INDICATOR.options
-
-    return Question(
-        id="entry_indicator",
-        text="Which indicator should trigger your entry?",
-        options=options,
-        allow_custom=True,
-    )
+        return _ENTRY_QUESTION_TREND
+    return QUESTION_ENTRY_INDICATOR
 
 
-def _get_entry_params_question(indicator: str) -> Question:
-    """Get entry params question based on indicator."""
+@lru_cache(maxsize=64)
+def get_entry_params_question(indicator: str) -> Question:
+    """Get entry params question based on indicator (memoized, shared instance)."""
     if indicator == "RSI":
         return QUESTION_RSI_OVERSOLD
     elif indicator in ("SMA", "EMA"):
@@ -86,8 +148,9 @@ def _get_entry_params_question(indicator: str) -> Question:
         )
 
 
-def _get_exit_params_question(indicator: str) -> Question:
-    """Get exit params question based on indicator."""
+@lru_cache(maxsize=64)
+def get_exit_params_question(indicator: str) -> Question:
+    """Get exit params question based on indicator (memoized, shared instance)."""
     if indicator == "RSI":
         return QUESTION_RSI_OVERBOUGHT
     else:
@@ -105,21 +168,9 @@ def handle_strategy_type(
     """Handle strategy type selection."""
     strategy = state.partial_strategy
 
-    if answer == "mean_reversion":
-        strategy.name = "Mean Reversion Strategy"
-        strategy.description = "Buy when oversold, sell when overbought"
-    elif answer == "trend_following":
-        strategy.name = "Trend Following Strategy"
-        strategy.description = "Follow the direction of the market trend"
-    elif answer == "breakout":
-        strategy.name = "Breakout Strategy"
-        strategy.description = "Trade when price breaks key levels"
-    elif answer == "calendar":
-        strategy.name = "Calendar Strategy"
-        strategy.description = "Trade based on calendar patterns"
-    else:
-        strategy.name = answer
-        strategy.description = f"Custom strategy: {answer}"
+    strategy.name, strategy.description = STRATEGY_TYPE_NAMES.get(
+        answer, (answer, f"Custom strategy: {answer}")
+    )
 
     advance_step(state)
 
@@ -155,7 +206,7 @@ def handle_universe_type(
         return ConversationResponse(
             type=ResponseType.QUESTION,
             message="Universe selected. Now let's define entry conditions.",
-            question=_get_entry_indicator_question(state),
+            question=get_entry_indicator_question(state),
         )
 
 
@@ -166,8 +217,7 @@ def handle_universe_details(
     strategy = state.partial_strategy
 
     if strategy.universe_type == "static":
-        symbols = [s.strip().upper() for s in answer.split(",")]
-        strategy.symbols = symbols
+        strategy.symbols = [s for s in _SYMBOL_SPLIT_RE.split(answer.strip().upper()) if s]
     elif strategy.universe_type == "screener":
         strategy.index = answer
 
@@ -176,7 +226,7 @@ def handle_universe_details(
     return ConversationResponse(
         type=ResponseType.QUESTION,
         message="Universe configured. Now let's define entry conditions.",
-        question=_get_entry_indicator_question(state),
+        question=get_entry_indicator_question(state),
     )
 
 
@@ -184,10 +234,11 @@ def handle_entry_indicator(
     state: ConversationState, answer: str
 ) -> ConversationResponse:
     """Handle entry indicator selection."""
-    state.partial_strategy.entry_indicator = answer.upper()
+    indicator = answer.upper()
+    state.partial_strategy.entry_indicator = indicator
     advance_step(state)
 
-    question = _get_entry_params_question(answer.upper())
+    question = get_entry_params_question(indicator)
 
     return ConversationResponse(
         type=ResponseType.QUESTION,
@@ -203,10 +254,7 @@ def handle_entry_params(
     strategy = state.partial_strategy
     indicator = strategy.entry_indicator
 
-    try:
-        threshold = float(answer)
-    except ValueError:
-        threshold = 30  # Default
+    threshold = _parse_float(answer, 30)  # Default 30
 
     strategy.entry_threshold = threshold
     strategy.entry_operator = "<" if indicator == "RSI" else ">"
@@ -230,7 +278,7 @@ def handle_entry_params(
     return ConversationResponse(
         type=ResponseType.QUESTION,
         message=f"Entry at {indicator} < {threshold}. Now let's set exit conditions.",
-        question=_get_exit_params_question(indicator),
+        question=get_exit_params_question(indicator),
     )
 
 
@@ -240,10 +288,7 @@ def handle_exit_params(
     """Handle exit parameters."""
     strategy = state.partial_strategy
 
-    try:
-        threshold = float(answer)
-    except ValueError:
-        threshold = 70  # Default
+    threshold = _parse_float(answer, 70)  # Default 70
 
     strategy.exit_threshold = threshold
     strategy.exit_operator = ">"
@@ -261,10 +306,7 @@ def handle_position_size(
     state: ConversationState, answer: str
 ) -> ConversationResponse:
     """Handle position size."""
-    try:
-        size = float(answer)
-    except ValueError:
-        size = 10
+    size = _parse_float(answer, 10)
 
     state.partial_strategy.sizing_type = "percent_of_equity"
     state.partial_strategy.sizing_value = size
@@ -283,10 +325,8 @@ def handle_stop_loss(
 ) -> ConversationResponse:
     """Handle stop loss setting."""
     if answer != "none":
-        try:
-            state.partial_strategy.stop_loss_pct = float(answer)
-        except ValueError:
-            pass
+        strategy = state.partial_strategy
+        strategy.stop_loss_pct = _parse_float(answer, strategy.stop_loss_pct)
 
     advance_step(state)
 
@@ -302,10 +342,8 @@ def handle_take_profit(
 ) -> ConversationResponse:
     """Handle take profit setting."""
     if answer != "none":
-        try:
-            state.partial_strategy.take_profit_pct = float(answer)
-        except ValueError:
-            pass
+        strategy = state.partial_strategy
+        strategy.take_profit_pct = _parse_float(answer, strategy.take_profit_pct)
 
     advance_step(state)
 
@@ -320,16 +358,13 @@ def handle_max_positions(
     state: ConversationState, answer: str
 ) -> ConversationResponse:
     """Handle max positions setting."""
-    try:
-        state.partial_strategy.max_positions = int(answer)
-    except ValueError:
-        state.partial_strategy.max_positions = 10
+    state.partial_strategy.max_positions = _parse_int(answer, 10)
 
     advance_step(state)
 
     # Generate preview
     strategy_dict = state.partial_strategy.to_utss_dict()
-    preview = yaml.dump(strategy_dict, default_flow_style=False, sort_keys=False)
+    preview = dump_strategy_yaml(state, strategy_dict)
 
     return ConversationResponse(
         type=ResponseType.CONFIRMATION,
@@ -344,12 +379,10 @@ def handle_confirm(
     state: ConversationState, answer: str
 ) -> ConversationResponse:
     """Handle final confirmation."""
-    if answer.lower() in ("yes", "y", "true", "1"):
+    if answer.lower() in _AFFIRMATIVE:
         state.is_complete = True
         strategy_dict = state.partial_strategy.to_utss_dict()
-        strategy_yaml = yaml.dump(
-            strategy_dict, default_flow_style=False, sort_keys=False
-        )
+        strategy_yaml = dump_strategy_yaml(state, strategy_dict)
 
         return ConversationResponse(
             type=ResponseType.COMPLETE,
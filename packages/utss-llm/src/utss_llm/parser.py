@@ -2,10 +2,14 @@
 Main strategy parser - converts natural language to UTSS strategies.
 """
 
+import copy
 import re
-from dataclasses import dataclass, field
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass, field, replace
 from enum import Enum
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import yaml
 
@@ -15,6 +19,34 @@ from utss_llm.prompts import ADVANCED_TEMPLATE
 from utss_llm.prompts.templates import ENHANCED_SYSTEM_PROMPT
 from utss_llm.providers.base import LLMProvider
 
+if TYPE_CHECKING:
+    import asyncio
+
+# Only spaces/tabs may follow the fence tag: letting the gap span newlines
+# makes unterminated blocks backtrack quadratically
+_YAML_BLOCK_RE = re.compile(r"```(?:yaml|yml)?[^\S\n]*\n(.*?)```", re.DOTALL)
+_ASSUMPTION_RES = tuple(
+    re.compile(pattern, re.IGNORECASE | re.MULTILINE)
+    for pattern in (
+        r"Assumptions?:\s*\n((?:[-•*]\s*.+\n?)+)",
+        r"I (?:assumed|am assuming)(.+?)(?:\.|$)",
+        r"Default(?:s|ing to)?:?\s*(.+?)(?:\.|$)",
+    )
+)
+_BULLET_RE = re.compile(r"^[-•*]\s*")
+# Lines (ignoring indentation) that open or end a bare YAML document
+_YAML_START_RE = re.compile(r"^[^\S\n]*(?:info:|\$schema:|---)", re.MULTILINE)
+_YAML_STOP_RE = re.compile(r"^[^\S\n]*(?:Note:|Assumptions:|---)", re.MULTILINE)
+# Context keys included in the prompt, in order, with how each is rendered
+_CONTEXT_FIELDS: tuple[tuple[str, Callable[[Any], str]], ...] = (
+    ("symbols", lambda symbols: f"Symbols: {', '.join(symbols)}"),
+    ("market", lambda market: f"Market: {market}"),
+    ("timeframe", lambda timeframe: f"Timeframe: {timeframe}"),
+)
+
+# LibYAML's loader when PyYAML was built with it
+_SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class ParseMode(str, Enum):
     """Parsing modes for strategy generation."""
@@ -23,7 +55,7 @@ class ParseMode(str, Enum):
     ADVANCED = "advanced"  # One-shot generation
 
 
-@dataclass
+@dataclass(slots=True)
 class ParseResult:
     """Result of parsing natural language to strategy."""
 
@@ -64,6 +96,7 @@ class StrategyParser:
         provider: LLMProvider,
         mode: ParseMode = ParseMode.ADVANCED,
         validate: bool = True,
+        cache_size: int = 0,
     ):
         """
         Initialize the parser.
@@ -72,10 +105,39 @@ class StrategyParser:
             provider: LLM provider to use for generation
             mode: Parsing mode (beginner or advanced)
             validate: Whether to validate generated strategies
+            cache_size: Number of successful results to reuse for repeated
+                prompts (0 disables caching). Cached results are returned as
+                copies with ``tokens_used=0``.
         """
         self.provider = provider
         self.mode = mode
         self.validate = validate
+        self.cache_size = cache_size
+        # Successful results keyed by prompt, least recently used first
+        self._cache: OrderedDict[str, ParseResult] = OrderedDict()
+        # Event loop reused by parse_sync() in the thread that first called it
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread: int | None = None
+        self._loop_lock = threading.Lock()
+
+    def __enter__(self) -> "StrategyParser":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the event loop used by parse_sync().
+
+        A loop that is still running is left alone. Later parse_sync() calls
+        open a new loop.
+        """
+        with self._loop_lock:
+            loop = self._loop
+            if loop is None or loop.is_running():
+                return
+            self._loop = None
+        loop.close()
 
     async def parse(
         self,
@@ -93,17 +155,10 @@ class StrategyParser:
             ParseResult with strategy or errors
         """
         # Build context string
-        context_str = ""
-        if context:
-            context_parts = []
-            if "symbols" in context:
-                context_parts.append(f"Symbols: {', '.join(context['symbols'])}")
-            if "market" in context:
-                context_parts.append(f"Market: {context['market']}")
-            if "timeframe" in context:
-                context_parts.append(f"Timeframe: {context['timeframe']}")
-            if context_parts:
-                context_str = "Context:\n" + "\n".join(context_parts)
+        context_parts = [
+            render(context[key]) for key, render in _CONTEXT_FIELDS if context and key in context
+        ]
+        context_str = "Context:\n" + "\n".join(context_parts) if context_parts else ""
 
         # Build prompt
         prompt = ADVANCED_TEMPLATE.format(
@@ -111,6 +166,24 @@ class StrategyParser:
             context=context_str,
         )
 
+        if self.cache_size:
+            cached = self._cache.get(prompt)
+            if cached is not None:
+                self._cache.move_to_end(prompt)
+                # Hand out a private copy; no tokens were spent on this result
+                return replace(copy.deepcopy(cached), tokens_used=0)
+
+        result = await self._parse_prompt(prompt)
+
+        if self.cache_size and result.success:
+            self._cache[prompt] = copy.deepcopy(result)
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+        return result
+
+    async def _parse_prompt(self, prompt: str) -> ParseResult:
+        """Generate a strategy for a fully built prompt."""
         # Call LLM
         try:
             response = await self.provider.generate(
@@ -163,7 +236,7 @@ class StrategyParser:
         else:
             # Return without validation
             try:
-                data = yaml.safe_load(yaml_content)
+                data = yaml.load(yaml_content, Loader=_SafeLoader)
                 strategy = Strategy.model_validate(data) if data else None
             except Exception:
                 strategy = None
@@ -267,58 +340,52 @@ Only ask questions if truly necessary. Most strategies can use sensible defaults
         """
         import asyncio
 
-        return asyncio.run(self.parse(description, context))
+        with self._loop_lock:
+            if self._loop is None or self._loop.is_closed():
+                self._loop = asyncio.new_event_loop()
+                self._loop_thread = threading.get_ident()
+            loop = self._loop
+            owned = self._loop_thread == threading.get_ident() and not loop.is_running()
+
+        if not owned:
+            # Other threads (and nested calls) run on a throwaway loop
+            return asyncio.run(self.parse(description, context))
+        return loop.run_until_complete(self.parse(description, context))
 
     def _extract_yaml(self, content: str) -> str | None:
         """Extract YAML content from LLM response."""
         # Try to find YAML in code blocks
-        yaml_pattern = r"```(?:yaml|yml)?\s*\n(.*?)```"
-        matches = re.findall(yaml_pattern, content, re.DOTALL)
+        matches = _YAML_BLOCK_RE.findall(content)
 
         if matches:
             # Return the longest match (most complete)
             return max(matches, key=len).strip()
 
         # Try to find YAML starting with common keys
-        lines = content.split("\n")
-        yaml_start = -1
-        for i, line in enumerate(lines):
-            stripped = line.strip()
-            if stripped.startswith(("info:", "$schema:", "---")):
-                yaml_start = i
-                break
-
-        if yaml_start >= 0:
-            # Extract from start to end or next non-YAML content
-            yaml_lines = []
-            for line in lines[yaml_start:]:
-                # Stop at obvious non-YAML content
-                if line.strip().startswith(("Note:", "Assumptions:", "---")) and yaml_lines:
-                    break
-                yaml_lines.append(line)
-
-            return "\n".join(yaml_lines).strip()
-
-        return None
+        start = _YAML_START_RE.search(content)
+        if start is None:
+            return None
+
+        # Extract from start to end or next non-YAML content
+        first_newline = content.find("\n", start.start())
+        if first_newline < 0:
+            return content[start.start() :].strip()
+        stop = _YAML_STOP_RE.search(content, first_newline + 1)
+        end = stop.start() if stop else len(content)
+        return content[start.start() : end].strip()
 
     def _extract_assumptions(self, content: str) -> list[str]:
         """Extract any assumptions mentioned by the LLM."""
         assumptions = []
 
         # Look for assumptions section
-        assumption_patterns = [
-            r"Assumptions?:\s*\n((?:[-•*]\s*.+\n?)+)",
-            r"I (?:assumed|am assuming)(.+?)(?:\.|$)",
-            r"Default(?:s|ing to)?:?\s*(.+?)(?:\.|$)",
-        ]
-
-        for pattern in assumption_patterns:
-            matches = re.findall(pattern, content, re.IGNORECASE | re.MULTILINE)
+        for pattern in _ASSUMPTION_RES:
+            matches = pattern.findall(content)
             for match in matches:
                 if isinstance(match, str):
                     # Clean up and split by bullets
                     for line in match.split("\n"):
-                        line = re.sub(r"^[-•*]\s*", "", line.strip())
+                        line = _BULLET_RE.sub("", line.strip())
                         if line and len(line) > 5:
                             assumptions.append(line)
 
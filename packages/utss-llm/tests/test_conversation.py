@@ -19,6 +19,8 @@ from utss_llm.conversation import (
     get_session,
 )
 from utss_llm.conversation.llm_adapter import (
+    REVISION_PROMPT,
+    _revision_summary,
     apply_updates,
     extract_json,
     llm_revise,
@@ -26,6 +28,7 @@ from utss_llm.conversation.llm_adapter import (
     skip_to_unanswered,
     smart_start,
 )
+from utss_llm.conversation.state import Turn
 from utss_llm.providers.base import LLMProvider, LLMResponse
 
 
@@ -67,6 +70,25 @@ class TestQuestion:
         q = Question(id="test", text="Enter value")
         assert not q.has_options
 
+    def test_match_option_by_id_or_label(self):
+        """Should match option ids and labels case-insensitively."""
+        q = Question(
+            id="test",
+            text="Choose one",
+            options=[
+                Option(id="mean_reversion", label="Mean Reversion"),
+                Option(id="calendar", label="Calendar-based"),
+            ],
+        )
+        assert q.match_option("MEAN_REVERSION") == "mean_reversion"
+        assert q.match_option("calendar-BASED") == "calendar"
+        assert q.match_option("momentum") is None
+
+    def test_match_option_casefolds(self):
+        """Should match labels that only differ under Unicode casefolding."""
+        q = Question(id="test", text="?", options=[Option(id="gross", label="Groß")])
+        assert q.match_option("GROSS") == "gross"
+
 
 class TestPartialStrategy:
     """Tests for PartialStrategy."""
@@ -80,6 +102,11 @@ class TestPartialStrategy:
         assert result["info"]["name"] == "Test Strategy"
         assert result["info"]["id"] == "test_strategy"
 
+    def test_id_slug_replaces_hyphens(self):
+        """Hyphens and spaces should both map to underscores in the id."""
+        ps = PartialStrategy(name="RSI Mean-Reversion")
+        assert ps.to_utss_dict()["info"]["id"] == "rsi_mean_reversion"
+
     def test_to_utss_dict_with_universe(self):
         """Should include universe if set."""
         ps = PartialStrategy(
@@ -124,6 +151,16 @@ class TestPartialStrategy:
         assert result["constraints"]["take_profit"]["percent"] == 15
         assert result["constraints"]["max_positions"] == 10
 
+    def test_to_utss_dict_reflects_in_place_edits(self):
+        """Each call should build a fresh dict from the current fields."""
+        ps = PartialStrategy(name="Test", universe_type="static", symbols=["AAPL"])
+        first = ps.to_utss_dict()
+
+        ps.symbols.append("MSFT")
+        second = ps.to_utss_dict()
+        assert second is not first
+        assert second["universe"]["symbols"] == ["AAPL", "MSFT"]
+
 
 class TestConversationState:
     """Tests for ConversationState."""
@@ -153,6 +190,28 @@ class TestConversationState:
 
         assert state.last_question == q
 
+    def test_state_dataclasses_use_slots(self):
+        """Per-turn and per-session objects shouldn't carry an instance __dict__."""
+        state = ConversationState()
+        state.add_turn("user", "Hello")
+        for obj in (state, state.partial_strategy, state.history[0]):
+            assert not hasattr(obj, "__dict__")
+
+    def test_preview_cache_ignored_in_equality(self):
+        """A rendered preview shouldn't make otherwise equal states differ."""
+        state = ConversationState()
+        state._preview_cache = ("{}", "rendered")
+        assert state == ConversationState()
+
+    def test_last_question_survives_plain_turns(self):
+        """Turns without a question shouldn't clear the last question."""
+        q = Question(id="test", text="Test?")
+        state = ConversationState(history=[Turn(role="assistant", content="Q", question=q)])
+        assert state.last_question is q
+
+        state.add_turn("user", "answer")
+        assert state.last_question is q
+
 
 class TestStrategyBuilder:
     """Tests for StrategyBuilder."""
@@ -165,6 +224,9 @@ class TestStrategyBuilder:
         assert response.type == ResponseType.QUESTION
         assert response.question is not None
         assert response.question.id == "strategy_type"
+        assert builder.get_initial_question() is response
+        with pytest.raises(AttributeError):
+            response.message = "changed"
 
     def test_process_strategy_type(self):
         """Should advance to universe question."""
@@ -177,6 +239,20 @@ class TestStrategyBuilder:
         assert state.partial_strategy.name == "Mean Reversion Strategy"
         assert response.question.id == "universe_type"
 
+    def test_entry_indicator_question_shared(self):
+        """Entry indicator questions are prebuilt and frozen."""
+        builder = StrategyBuilder()
+        state = ConversationState(current_step="strategy_type")
+        builder.process_answer(state, "mean_reversion")
+        builder.process_answer(state, "static")
+
+        first = builder.process_answer(state, "AAPL").question
+        state.current_step = "universe_details"
+        assert builder.process_answer(state, "MSFT").question is first
+        assert first.options[0].id == "RSI"
+        with pytest.raises(AttributeError):
+            first.text = "changed"
+
     def test_full_guided_flow(self):
         """Should complete full flow with guided answers."""
         builder = StrategyBuilder()
@@ -192,8 +268,9 @@ class TestStrategyBuilder:
         assert response.question.id == "symbols"
 
         # Symbols
-        response = builder.process_answer(state, "AAPL, MSFT")
+        response = builder.process_answer(state, " aapl ,MSFT,, ")
         assert response.question is not None
+        assert state.partial_strategy.symbols == ["AAPL", "MSFT"]
 
         # Entry indicator
         response = builder.process_answer(state, "RSI")
@@ -201,6 +278,41 @@ class TestStrategyBuilder:
         # Continue through the flow...
         # (simplified test - just checking it doesn't crash)
 
+    def test_numeric_answers_fall_back_to_defaults(self):
+        """Unparseable numbers should use defaults or keep prior values."""
+        builder = StrategyBuilder()
+        state = ConversationState(current_step="position_size")
+        state.partial_strategy.stop_loss_pct = 5.0
+
+        builder.process_answer(state, " 12.5 ")
+        builder.process_answer(state, "five")
+        builder.process_answer(state, "1e1")
+        builder.process_answer(state, "ten")
+
+        ps = state.partial_strategy
+        assert ps.sizing_value == 12.5
+        assert ps.stop_loss_pct == 5.0
+        assert ps.take_profit_pct == 10.0
+        assert ps.max_positions == 10
+
+    def test_oversized_integer_answer_uses_default(self):
+        """An integer too long for int() should fall back like other bad input."""
+        builder = StrategyBuilder()
+        state = ConversationState(current_step="max_positions")
+
+        builder.process_answer(state, "9" * 5000)
+
+        assert state.partial_strategy.max_positions == 10
+
+    def test_numeric_answers_accept_python_literals(self):
+        """Anything int()/float() accepts, such as underscores, should parse."""
+        builder = StrategyBuilder()
+        state = ConversationState(current_step="max_positions")
+
+        builder.process_answer(state, "1_000")
+
+        assert state.partial_strategy.max_positions == 1000
+
 
 class TestConversationSession:
     """Tests for ConversationSession."""
@@ -242,6 +354,44 @@ class TestConversationSession:
         preview = session.get_preview()
         assert "name: Test" in preview
 
+    def test_preview_reused_until_strategy_changes(self):
+        """Unchanged strategy should reuse the rendered YAML."""
+        session = ConversationSession()
+        session.state.partial_strategy.name = "Test"
+
+        first = session.get_preview()
+        assert session.get_preview() is first
+
+        session.state.partial_strategy.symbols = ["AAPL"]
+        session.state.partial_strategy.universe_type = "static"
+        assert "AAPL" in session.get_preview()
+
+        session.state.partial_strategy.symbols.append("MSFT")
+        assert "MSFT" in session.get_preview()
+
+    def test_export_dict_is_a_private_copy(self):
+        """Mutating an exported dict must not leak into later exports."""
+        session = ConversationSession()
+        session.state.partial_strategy.name = "Test"
+        session.state.is_complete = True
+
+        exported = session.export_dict()
+        exported["info"]["name"] = "hacked"
+
+        assert "name: Test" in session.export()
+        assert session.export_dict()["info"]["name"] == "Test"
+
+    @pytest.mark.asyncio
+    async def test_response_strategy_dict_is_a_private_copy(self):
+        """Mutating a response's strategy_dict must not change the preview."""
+        session = ConversationSession()
+        session.state.partial_strategy.name = "Test"
+
+        response = await session.revise("nothing to change")
+        response.strategy_dict["info"]["name"] = "hacked"
+
+        assert "name: Test" in session.get_preview()
+
     @pytest.mark.asyncio
     async def test_revise_strategy(self):
         """Should allow revision of strategy."""
@@ -330,6 +480,30 @@ class TestSmartStartExtraction:
 
         assert result is None
 
+    def test_extract_json_embedded_in_prose(self):
+        """Should fall back to the first object when wrapped in text."""
+        result = extract_json('Sure! {"stop_loss_pct": 3} Let me know.')
+
+        assert result == {"stop_loss_pct": 3}
+
+    def test_extract_json_nested_in_prose(self):
+        """Should return the whole nested object, skipping stray braces."""
+        content = 'Use {this}: {"indicators": ["RSI"], "params": {"period": 14}} ok'
+        result = extract_json(content)
+
+        assert result == {"indicators": ["RSI"], "params": {"period": 14}}
+
+    def test_extract_json_unterminated_fence_is_fast(self):
+        """A fence followed by many blank lines must not backtrack quadratically."""
+        start = time.perf_counter()
+        assert extract_json("{ ```json \n" + " \n" * 40_000) is None
+        assert time.perf_counter() - start < 1.0
+
+    @pytest.mark.parametrize("prefix", ["", "Sure: ", "```json\n"])
+    def test_extract_json_too_deeply_nested(self, prefix):
+        """Pathologically nested input should return None, not raise."""
+        assert extract_json(prefix + '{"a":' * 100_000) is None
+
     def test_prefill_strategy_type(self):
         """Should prefill strategy type from extraction."""
         ps = PartialStrategy()
@@ -414,6 +588,20 @@ class TestSmartStartExtraction:
 
         assert response.question.id == "universe_type"
 
+    def test_skip_to_unanswered_entry_params(self):
+        """Should ask for the entry threshold of the chosen indicator."""
+        session = ConversationSession()
+        ps = session.state.partial_strategy
+        ps.name = "Mean Reversion Strategy"
+        ps.universe_type = "static"
+        ps.symbols = ["AAPL"]
+        ps.entry_indicator = "RSI"
+
+        response = skip_to_unanswered(session.state, session.builder)
+
+        assert session.state.current_step == "entry_params"
+        assert response.question.id == "rsi_oversold"
+
     def test_skip_to_confirm_when_complete(self):
         """Should show preview if most fields filled."""
         session = ConversationSession()
@@ -633,10 +821,49 @@ class TestSmartStartWithMock:
         assert response.type == ResponseType.QUESTION
         assert response.question.id == "strategy_type"
 
+    @pytest.mark.asyncio
+    async def test_trivial_prompt_skips_llm(self):
+        """Greeting-only prompts should go straight to the guided flow."""
+        provider = MockProvider('{"strategy_type": "mean_reversion"}')
+        session = ConversationSession(provider=provider, use_llm=True)
+
+        response = await session.start("Hi! Help me build a strategy, please.")
+        assert response.question.id == "strategy_type"
+
+        response = await session.start("RSI reversal strategy")
+        assert response.question.id == "universe_type"
+
 
 class TestLLMReviseWithMock:
     """Tests for llm_revise using MockProvider."""
 
+    def test_revision_summary_omits_unset_fields(self):
+        """Prompt summary should list only the configured fields."""
+        ps = PartialStrategy(entry_indicator="RSI", entry_threshold=30, stop_loss_pct=5)
+
+        summary = _revision_summary(ps)
+
+        assert summary.splitlines() == [
+            "- Entry indicator: RSI",
+            "- Entry threshold: 30",
+            "- Stop loss: 5%",
+        ]
+        assert _revision_summary(PartialStrategy()) == "- Nothing configured yet"
+
+    def test_revision_prompt_keeps_field_placeholders(self):
+        """The public template should still format with the per-field names."""
+        prompt = REVISION_PROMPT.format(
+            entry_indicator="RSI",
+            entry_threshold=30,
+            exit_indicator="N/A",
+            exit_threshold="N/A",
+            stop_loss=5,
+            position_size=10,
+            instruction="tighten the stop",
+        )
+
+        assert "- Stop loss: 5%" in prompt
+
     @pytest.mark.asyncio
     async def test_apply_llm_updates(self):
         """Should apply updates extracted by LLM."""
@@ -717,3 +944,26 @@ class TestSessionTTL:
 
         assert manager.get(old_id) is None
         assert manager.get(new_session.session_id) is new_session
+
+
+class TestSessionLimit:
+    """Tests for the bounded session store."""
+
+    def test_evicts_least_recently_used(self):
+        """Should evict the least recently used session past max_sessions."""
+        manager = SessionManager(max_sessions=2)
+        first = manager.create()
+        second = manager.create()
+        manager.get(first.session_id)  # first is now most recently used
+
+        third = manager.create()
+
+        assert manager.get(second.session_id) is None
+        assert manager.get(first.session_id) is first
+        assert manager.get(third.session_id) is third
+
+    @pytest.mark.parametrize("max_sessions", [0, -1])
+    def test_rejects_non_positive_limit(self, max_sessions):
+        """A limit below one session is a configuration error."""
+        with pytest.raises(ValueError, match="max_sessions"):
+            SessionManager(max_sessions=max_sessions)
@@ -173,6 +173,28 @@ async def test_parse_with_context():
     assert result.success is True
 
 
+@pytest.mark.asyncio
+async def test_parse_context_in_prompt():
+    """Known context keys should be rendered into the prompt in a fixed order."""
+
+    class RecordingProvider(MockProvider):
+        async def generate(self, prompt: str, **kwargs) -> LLMResponse:
+            self.prompt = prompt
+            return await super().generate(prompt, **kwargs)
+
+    provider = RecordingProvider(response=VALID_RSI_YAML)
+    parser = StrategyParser(provider=provider)
+
+    await parser.parse(
+        "RSI strategy",
+        context={"timeframe": "1d", "symbols": ["AAPL", "MSFT"], "other": "x"},
+    )
+    assert "Context:\nSymbols: AAPL, MSFT\nTimeframe: 1d\n" in provider.prompt
+
+    await parser.parse("RSI strategy", context={"other": "x"})
+    assert "Context:" not in provider.prompt
+
+
 @pytest.mark.asyncio
 async def test_parse_without_validation():
     """Test parsing without validation."""
@@ -196,6 +218,35 @@ def test_parse_sync():
     assert result.strategy is not None
 
 
+def test_parse_sync_reuses_event_loop():
+    """Repeated synchronous parses should share one event loop until closed."""
+    with StrategyParser(provider=MockProvider(response=VALID_RSI_YAML)) as parser:
+        assert parser.parse_sync("RSI strategy").success is True
+        loop = parser._loop
+        assert parser.parse_sync("RSI strategy").success is True
+        assert parser._loop is loop
+
+    assert loop.is_closed()
+    assert parser._loop is None
+
+
+def test_parse_sync_from_several_threads():
+    """Concurrent parse_sync calls on one parser should all succeed."""
+    import asyncio
+    from concurrent.futures import ThreadPoolExecutor
+
+    class SlowProvider(MockProvider):
+        async def generate(self, prompt: str, **kwargs) -> LLMResponse:
+            await asyncio.sleep(0.05)
+            return await super().generate(prompt, **kwargs)
+
+    with StrategyParser(provider=SlowProvider(response=VALID_RSI_YAML)) as parser:
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            results = list(pool.map(parser.parse_sync, ["RSI strategy"] * 4))
+
+    assert all(result.success for result in results)
+
+
 def test_extract_yaml_from_code_block():
     """Test YAML extraction from code block."""
     provider = MockProvider()
@@ -206,6 +257,17 @@ def test_extract_yaml_from_code_block():
     assert "info:" in yaml_content
 
 
+def test_extract_yaml_unterminated_fence_is_fast():
+    """A fence followed by many blank lines must not backtrack quadratically."""
+    import time
+
+    parser = StrategyParser(provider=MockProvider())
+
+    start = time.perf_counter()
+    assert parser._extract_yaml("```yaml \n" + " \n" * 40_000) is None
+    assert time.perf_counter() - start < 1.0
+
+
 def test_extract_yaml_without_code_block():
     """Test YAML extraction without code block."""
     provider = MockProvider()
@@ -225,6 +287,22 @@ universe:
     assert "info:" in yaml_content
 
 
+def test_extract_yaml_without_code_block_stops_at_notes():
+    """Bare YAML should end at the first trailing note or document marker."""
+    parser = StrategyParser(provider=MockProvider())
+
+    content = """Here you go:
+  info:
+    id: test
+universe:
+  type: static
+Note: adjust the symbols as needed
+more prose"""
+
+    assert parser._extract_yaml(content) == "info:\n    id: test\nuniverse:\n  type: static"
+    assert parser._extract_yaml("no yaml here") is None
+
+
 def test_extract_assumptions():
     """Test assumption extraction."""
     provider = MockProvider()
@@ -292,3 +370,71 @@ Q: What's your risk tolerance?"""
     assert isinstance(result, list)
     assert len(result) <= 3
     assert any("symbol" in q.lower() for q in result)
+
+
+class CountingProvider(MockProvider):
+    """Mock provider that counts generate() calls."""
+
+    def __init__(self, response: str = ""):
+        super().__init__(response)
+        self.calls = 0
+
+    async def generate(self, prompt: str, **kwargs) -> LLMResponse:
+        self.calls += 1
+        return await super().generate(prompt, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_parse_cache_reuses_successful_result():
+    """Repeated prompts should skip the LLM when caching is enabled."""
+    provider = CountingProvider(response=VALID_RSI_YAML)
+    parser = StrategyParser(provider=provider, cache_size=2)
+
+    first = await parser.parse("RSI strategy", context={"symbols": ["AAPL"]})
+    first.assumptions.append("edited by caller")
+    first.strategy.info.name = "Edited"
+
+    second = await parser.parse("RSI strategy", context={"symbols": ["AAPL"]})
+    assert provider.calls == 1
+    assert second.success is True
+    assert second.tokens_used == 0
+    assert "edited by caller" not in second.assumptions
+    assert second.strategy.info.name == "RSI Test Strategy"
+    assert second.yaml_output == first.yaml_output
+
+    await parser.parse("RSI strategy", context={"symbols": ["MSFT"]})
+    await parser.parse("Another strategy")
+    await parser.parse("RSI strategy", context={"symbols": ["AAPL"]})
+    assert provider.calls == 4  # evicted as least recently used
+
+
+@pytest.mark.asyncio
+async def test_parse_cache_skips_failures_and_is_off_by_default():
+    """Failed parses are retried, and parsers don't cache unless asked to."""
+    failing = CountingProvider(response="no yaml here")
+    parser = StrategyParser(provider=failing, cache_size=4)
+    await parser.parse("Some strategy")
+    await parser.parse("Some strategy")
+    assert failing.calls == 2
+
+    provider = CountingProvider(response=VALID_RSI_YAML)
+    parser = StrategyParser(provider=provider)
+    await parser.parse("RSI strategy")
+    await parser.parse("RSI strategy")
+    assert provider.calls == 2
+
+
+def test_package_import_defers_conversation():
+    """Importing the package shouldn't load conversation until a name is used."""
+    import subprocess
+    import sys
+
+    script = (
+        "import sys, utss_llm\n"
+        "assert 'utss_llm.conversation' not in sys.modules\n"
+        "assert set(utss_llm.__all__) <= set(dir(utss_llm))\n"
+        "for name in utss_llm.__all__:\n"
+        "    getattr(utss_llm, name)\n"
+        "assert 'utss_llm.conversation' in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", script], check=True)